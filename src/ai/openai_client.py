@@ -52,6 +52,12 @@ class CircuitBreaker:
             self.state = "OPEN"
             self.opened_at = time.time()
 
+    def reset(self):
+        """Return to the initial CLOSED state, clearing failure history."""
+        self.failures = 0
+        self.state = "CLOSED"
+        self.opened_at = 0.0
+
 
 class AzureOpenAIClient:
     def __init__(
@@ -21,6 +21,14 @@ from src.ai.prompt_templates import (
 )
 from src.models.schemas import AIExtractedDataCreate
 
+# orjson is stricter than json: NaN/Infinity and lone surrogates are invalid JSON
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 
 def build_messages(redacted_text: str) -> list:
     """Build chat messages with system prompt and few-shot example, plus user text."""
@@ -95,7 +103,7 @@ def analyze_text(
 
     # Try parse JSON
     try:
-        parsed = json.loads(content)
+        parsed = _json_loads(content)
     except Exception:
         return {"success": False, "error": "Invalid JSON returned by model"}
 
@@ -54,6 +54,7 @@ from .transformations import *
 __all__ += [
     # Transformation utilities
     "maintenance_log_create_to_orm",
+    "maintenance_log_create_batch_to_dicts",
     "maintenance_log_orm_to_read",
     "normalize_maintenance_log_data",
     "ai_extracted_data_create_to_orm",
@@ -11,6 +11,7 @@ This module defines all Pydantic schemas used throughout the system:
 from datetime import datetime
 from typing import Optional, List, Dict, Any, Union
 from pydantic import BaseModel, Field, validator, ConfigDict
+from pydantic.dataclasses import dataclass
 from enum import Enum
 
 
@@ -116,8 +117,17 @@ class MaintenanceLogRead(MaintenanceLogBase):
 # ============================================================================
 
 
-class ResolutionStep(BaseModel):
-    """Individual resolution step in structured format."""
+@dataclass(slots=True)
+class ResolutionStep:
+    """
+    Individual resolution step in structured format.
+
+    A slotted pydantic dataclass rather than a BaseModel: notifications can
+    carry many steps, and dropping the per-instance __dict__ cuts memory.
+    It therefore has no ``model_*`` methods; use
+    ``TypeAdapter(ResolutionStep).validate_python()`` / ``dump_python()``
+    (or ``dataclasses.asdict``) in place of ``model_validate`` / ``model_dump``.
+    """
 
     step_number: int = Field(..., ge=1, description="Step number")
     description: str = Field(..., description="Step description")
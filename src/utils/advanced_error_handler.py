@@ -9,10 +9,12 @@ import logging
 import time
 import json
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Callable, TypeVar, Union
+from typing import Dict, Any, Optional, Callable, Deque, TypeVar, Union
 from functools import wraps
 from enum import Enum
 import traceback
+from collections import deque
+from itertools import islice
 from dataclasses import dataclass, asdict
 
 logger = logging.getLogger(__name__)
@@ -75,23 +77,34 @@ class ErrorRecoveryStrategy(Enum):
     ALERT = "alert"
 
 
+_DEFAULT_RECOVERY_STRATEGIES: Dict[ErrorCategory, ErrorRecoveryStrategy] = {
+    ErrorCategory.CONNECTION: ErrorRecoveryStrategy.RETRY,
+    ErrorCategory.VALIDATION: ErrorRecoveryStrategy.SKIP,
+    ErrorCategory.PROCESSING: ErrorRecoveryStrategy.FALLBACK,
+    ErrorCategory.DATABASE: ErrorRecoveryStrategy.RETRY,
+    ErrorCategory.API: ErrorRecoveryStrategy.RETRY,
+    ErrorCategory.MEMORY: ErrorRecoveryStrategy.STOP,
+    ErrorCategory.NETWORK: ErrorRecoveryStrategy.RETRY,
+    ErrorCategory.TIMEOUT: ErrorRecoveryStrategy.RETRY,
+    ErrorCategory.UNKNOWN: ErrorRecoveryStrategy.ALERT,
+}
+
+
 class AdvancedErrorHandler:
     """Advanced error handler with recovery strategies."""
 
     def __init__(self, max_error_history: int = 1000):
-        self.error_history: List[ErrorRecord] = []
+        self.error_history: Deque[ErrorRecord] = deque(maxlen=max_error_history)
         self.max_error_history = max_error_history
-        self.recovery_strategies: Dict[ErrorCategory, ErrorRecoveryStrategy] = {
-            ErrorCategory.CONNECTION: ErrorRecoveryStrategy.RETRY,
-            ErrorCategory.VALIDATION: ErrorRecoveryStrategy.SKIP,
-            ErrorCategory.PROCESSING: ErrorRecoveryStrategy.FALLBACK,
-            ErrorCategory.DATABASE: ErrorRecoveryStrategy.RETRY,
-            ErrorCategory.API: ErrorRecoveryStrategy.RETRY,
-            ErrorCategory.MEMORY: ErrorRecoveryStrategy.STOP,
-            ErrorCategory.NETWORK: ErrorRecoveryStrategy.RETRY,
-            ErrorCategory.TIMEOUT: ErrorRecoveryStrategy.RETRY,
-            ErrorCategory.UNKNOWN: ErrorRecoveryStrategy.ALERT,
-        }
+        self.recovery_strategies: Dict[ErrorCategory, ErrorRecoveryStrategy] = dict(
+            _DEFAULT_RECOVERY_STRATEGIES
+        )
+
+    def clear(self):
+        """Drop recorded errors and restore the default recovery strategies."""
+        self.error_history.clear()
+        self.recovery_strategies.clear()
+        self.recovery_strategies.update(_DEFAULT_RECOVERY_STRATEGIES)
 
     def record_error(
         self,
@@ -113,12 +126,9 @@ class AdvancedErrorHandler:
             stack_trace=traceback.format_exc() if exception else None,
         )
 
+        # The deque drops its oldest entry on append once full
         self.error_history.append(error_record)
 
-        # Trim history if needed
-        if len(self.error_history) > self.max_error_history:
-            self.error_history = self.error_history[-self.max_error_history :]
-
         # Log based on severity
         log_message = f"[{category.value.upper()}] {message}"
         if details:
@@ -185,7 +195,8 @@ class AdvancedErrorHandler:
             "total_errors": len(errors),
             "by_category": by_category,
             "by_severity": by_severity,
-            "recent_errors": [e.to_dict() for e in errors[-10:]] if errors else [],
+            # Last 10 in recording order, without copying the history
+            "recent_errors": [e.to_dict() for e in islice(reversed(errors), 10)][::-1],
             "unresolved_errors": len([e for e in errors if not e.resolved]),
         }
 
@@ -201,7 +212,10 @@ class AdvancedErrorHandler:
     def clear_old_errors(self, older_than: timedelta = timedelta(days=7)):
         """Clear errors older than specified time."""
         cutoff = datetime.now() - older_than
-        self.error_history = [e for e in self.error_history if e.timestamp >= cutoff]
+        self.error_history = deque(
+            (e for e in self.error_history if e.timestamp >= cutoff),
+            maxlen=self.max_error_history,
+        )
         logger.info(f"Cleared errors older than {older_than}")
 
 
@@ -291,13 +305,18 @@ class CircuitBreaker:
         failure_threshold: int = 5,
         recovery_timeout: float = 60.0,
         expected_exceptions: tuple = (Exception,),
+        clock: Callable[[], float] = time.monotonic,
     ):
         self.failure_threshold = failure_threshold
         self.recovery_timeout = recovery_timeout
         self.expected_exceptions = expected_exceptions
+        self._clock = clock
 
         self.failure_count = 0
+        # Wall-clock timestamp for get_state() and logs; the recovery check
+        # uses the matching clock() reading instead
         self.last_failure_time = None
+        self._last_failure_clock = None
         self.state = "CLOSED"  # CLOSED, OPEN, HALF_OPEN
 
     def __call__(self, func: Callable[..., T]) -> Callable[..., T]:
@@ -333,6 +352,7 @@ class CircuitBreaker:
         """Record a failure."""
         self.failure_count += 1
         self.last_failure_time = time.time()
+        self._last_failure_clock = self._clock()
 
         if self.failure_count >= self.failure_threshold:
             self.state = "OPEN"
@@ -343,16 +363,17 @@ class CircuitBreaker:
 
     def _should_attempt_recovery(self) -> bool:
         """Check if we should attempt recovery."""
-        if not self.last_failure_time:
+        if self._last_failure_clock is None:
             return True
 
-        time_since_failure = time.time() - self.last_failure_time
+        time_since_failure = self._clock() - self._last_failure_clock
         return time_since_failure >= self.recovery_timeout
 
     def _reset(self):
         """Reset circuit breaker."""
         self.failure_count = 0
         self.last_failure_time = None
+        self._last_failure_clock = None
         self.state = "CLOSED"
         logger.info("Circuit breaker reset to CLOSED")
 
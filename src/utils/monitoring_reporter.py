@@ -7,8 +7,11 @@ capabilities for the backfill tool.
 
 import logging
 import time
+from collections import Counter, deque
+from heapq import nlargest
+from operator import itemgetter
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Callable
+from typing import Dict, List, Any, Optional, Callable, Deque, Tuple
 from dataclasses import dataclass, asdict
 import json
 import threading
@@ -25,8 +28,19 @@ class ReportLevel(Enum):
     DEBUG = "debug"
 
 
-@dataclass
-class ProcessingMetrics:
+# Number of recent (timestamp, processed_records) samples spanned by
+# records_per_second_avg
+RPS_WINDOW_SIZE = 60
+
+
+class _MetricsState:
+    """Slots for ProcessingMetrics internals, kept out of dataclass fields."""
+
+    __slots__ = ("_anchored_start", "_start_monotonic", "_rps_window")
+
+
+@dataclass(slots=True)
+class ProcessingMetrics(_MetricsState):
     """Metrics for processing performance."""
 
     total_records: int = 0
@@ -39,6 +53,23 @@ class ProcessingMetrics:
     cpu_usage_percent: float = 0.0
     batch_size: int = 1000
     success_rate: float = 0.0
+    records_per_second_avg: float = 0.0
+
+    def __post_init__(self):
+        # Internal state is not a field, so asdict() skips it
+        self._anchored_start = None
+        self._start_monotonic = 0.0
+        self._rps_window: Deque[Tuple[float, int]] = deque(maxlen=RPS_WINDOW_SIZE)
+
+    def _elapsed_seconds(self) -> float:
+        """Seconds since start_time, measured on the monotonic clock."""
+        if self.start_time is not self._anchored_start:
+            # start_time was (re)assigned; convert it to the monotonic clock once
+            self._anchored_start = self.start_time
+            self._start_monotonic = (
+                time.monotonic() - (datetime.now() - self.start_time).total_seconds()
+            )
+        return time.monotonic() - self._start_monotonic
 
     def update_success_rate(self):
         """Update success rate based on current metrics."""
@@ -50,16 +81,27 @@ class ProcessingMetrics:
             self.success_rate = 0.0
 
     def update_records_per_second(self):
-        """Update records per second based on elapsed time."""
+        """Update overall and recent records per second."""
         if self.start_time and self.processed_records > 0:
-            elapsed = (datetime.now() - self.start_time).total_seconds()
+            elapsed = self._elapsed_seconds()
             if elapsed > 0:
                 self.records_per_second = self.processed_records / elapsed
 
+                # Recent rate: records processed across the sample window
+                now = time.monotonic()
+                self._rps_window.append((now, self.processed_records))
+                first_time, first_records = self._rps_window[0]
+                if now > first_time:
+                    self.records_per_second_avg = (
+                        self.processed_records - first_records
+                    ) / (now - first_time)
+                else:
+                    self.records_per_second_avg = self.records_per_second
+
     def get_elapsed_time(self) -> Optional[timedelta]:
         """Get elapsed time since start."""
         if self.start_time:
-            return datetime.now() - self.start_time
+            return timedelta(seconds=self._elapsed_seconds())
         return None
 
     def get_estimated_time_remaining(self, total_records: int) -> Optional[timedelta]:
@@ -72,22 +114,29 @@ class ProcessingMetrics:
         return None
 
 
-@dataclass
+# Default number of recent errors kept by ErrorSummary
+MAX_RECENT_ERRORS = 10
+
+
+@dataclass(slots=True)
 class ErrorSummary:
     """Summary of errors encountered."""
 
     total_errors: int = 0
     error_types: Dict[str, int] = None  # type: ignore # error_type -> count
-    recent_errors: List[Dict[str, Any]] = None  # type: ignore # Last N errors
+    recent_errors: Deque[Dict[str, Any]] = None  # type: ignore # Last N errors
 
     def __post_init__(self):
         if self.error_types is None:
             self.error_types = {}
-        if self.recent_errors is None:
-            self.recent_errors = []
+        # Unbounded until the first add_error, which applies max_recent
+        self.recent_errors = deque(self.recent_errors or ())
 
     def add_error(
-        self, error_type: str, error_details: Dict[str, Any], max_recent: int = 10
+        self,
+        error_type: str,
+        error_details: Dict[str, Any],
+        max_recent: int = MAX_RECENT_ERRORS,
     ):
         """Add an error to the summary."""
         self.total_errors += 1
@@ -99,31 +148,31 @@ class ErrorSummary:
             "type": error_type,
             "details": error_details,
         }
+        # Keep only recent errors; the deque drops the oldest on append
+        if self.recent_errors.maxlen != max_recent:
+            self.recent_errors = deque(self.recent_errors, maxlen=max_recent)
         self.recent_errors.append(error_record)
 
-        # Keep only recent errors
-        if len(self.recent_errors) > max_recent:
-            self.recent_errors = self.recent_errors[-max_recent:]
-
     def get_top_errors(self, limit: int = 5) -> List[Dict[str, Any]]:
         """Get top error types."""
-        sorted_errors = sorted(
-            self.error_types.items(), key=lambda x: x[1], reverse=True
-        )
-        return [
-            {"type": err_type, "count": count}
-            for err_type, count in sorted_errors[:limit]
-        ]
+        # Same order as a stable descending sort, without sorting every type
+        top_errors = nlargest(limit, self.error_types.items(), key=itemgetter(1))
+        return [{"type": err_type, "count": count} for err_type, count in top_errors]
 
 
 class ProgressReporter:
     """Real-time progress reporter."""
 
-    def __init__(self, report_interval_seconds: int = 10):
+    def __init__(
+        self,
+        report_interval_seconds: int = 10,
+        clock: Callable[[], float] = time.time,
+    ):
         self.report_interval = report_interval_seconds
         self.metrics = ProcessingMetrics()
         self.error_summary = ErrorSummary()
-        self.last_report_time = time.time()
+        self._clock = clock
+        self.last_report_time = clock()
         self.callbacks: List[Callable[[Dict[str, Any]], None]] = []
 
     def start(self, total_records: int):
@@ -158,7 +207,7 @@ class ProgressReporter:
 
     def _check_report(self):
         """Check if it's time to generate a report."""
-        current_time = time.time()
+        current_time = self._clock()
         if current_time - self.last_report_time >= self.report_interval:
             self.generate_report()
             self.last_report_time = current_time
@@ -221,7 +270,7 @@ class ProgressReporter:
         }
 
         if level in [ReportLevel.DETAILED, ReportLevel.DEBUG]:
-            summary["recent_errors"] = self.error_summary.recent_errors
+            summary["recent_errors"] = list(self.error_summary.recent_errors)
 
         return summary
 
@@ -320,6 +369,9 @@ class ReportGenerator:
                     str(metrics.get_elapsed_time()) if metrics.start_time else None
                 ),
                 "performance": f"{metrics.records_per_second:.1f} records/sec",
+                "recent_performance": (
+                    f"{metrics.records_per_second_avg:.1f} records/sec"
+                ),
             },
             "errors": {
                 "total": errors.total_errors,
@@ -353,15 +405,12 @@ class ReportGenerator:
         metrics: ProcessingMetrics, errors: ErrorSummary, format: str = "json"
     ) -> str:
         """Generate a report for export."""
-        report = ReportGenerator.generate_detailed_report(metrics, errors)
-
-        if format == "json":
-            return json.dumps(report, indent=2, default=str)
-        elif format == "text":
-            return ReportGenerator._format_text_report(report)
-        else:
+        formatter = _EXPORT_FORMATTERS.get(format)
+        if formatter is None:
             raise ValueError(f"Unsupported format: {format}")
 
+        return formatter(ReportGenerator.generate_detailed_report(metrics, errors))
+
     @staticmethod
     def _generate_recommendations(
         metrics: ProcessingMetrics, errors: ErrorSummary
@@ -526,6 +575,7 @@ class ReportGenerator:
         lines.append(f"Success Rate: {summary['success_rate']}")
         lines.append(f"Duration: {summary['duration']}")
         lines.append(f"Performance: {summary['performance']}")
+        lines.append(f"Recent Performance: {summary['recent_performance']}")
         lines.append("")
 
         # Errors section
@@ -546,9 +596,86 @@ class ReportGenerator:
         return "\n".join(lines)
 
 
+def _format_json_report(report: Dict[str, Any]) -> str:
+    """Format report as JSON."""
+    return json.dumps(report, indent=2, default=str)
+
+
+# Export format -> formatter used by ReportGenerator.generate_export_report
+_EXPORT_FORMATTERS: Dict[str, Callable[[Dict[str, Any]], str]] = {
+    "json": _format_json_report,
+    "text": ReportGenerator._format_text_report,
+}
+
+
+def _high_error_rate_alert(
+    metrics: ProcessingMetrics, errors: ErrorSummary, thresholds: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Build the high error rate alert."""
+    error_rate = errors.total_errors / metrics.processed_records
+    return {
+        "severity": "high",
+        "message": f"Error rate {error_rate:.1%} exceeds threshold {thresholds['error_rate']:.1%}",
+        "metrics": {
+            "error_rate": error_rate,
+            "threshold": thresholds["error_rate"],
+        },
+    }
+
+
+def _high_memory_usage_alert(
+    metrics: ProcessingMetrics, errors: ErrorSummary, thresholds: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Build the high memory usage alert."""
+    return {
+        "severity": "medium",
+        "message": f"Memory usage {metrics.memory_usage_mb:.1f}MB exceeds threshold {thresholds['memory_usage_mb']}MB",
+        "metrics": {
+            "memory_usage_mb": metrics.memory_usage_mb,
+            "threshold": thresholds["memory_usage_mb"],
+        },
+    }
+
+
+def _low_throughput_alert(
+    metrics: ProcessingMetrics, errors: ErrorSummary, thresholds: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Build the low throughput alert."""
+    return {
+        "severity": "medium",
+        "message": f"Throughput {metrics.records_per_second:.1f} records/sec below threshold {thresholds['low_throughput']}",
+        "metrics": {
+            "records_per_second": metrics.records_per_second,
+            "threshold": thresholds["low_throughput"],
+        },
+    }
+
+
 class AlertManager:
     """Manage alerts for critical conditions."""
 
+    # Stateless threshold checks as (alert type, predicate, alert builder);
+    # predicates and builders take (metrics, errors, alert_thresholds)
+    _CHECKS = (
+        (
+            "high_error_rate",
+            lambda m, e, t: m.processed_records > 0
+            and e.total_errors / m.processed_records > t["error_rate"],
+            _high_error_rate_alert,
+        ),
+        (
+            "high_memory_usage",
+            lambda m, e, t: m.memory_usage_mb > t["memory_usage_mb"],
+            _high_memory_usage_alert,
+        ),
+        (
+            "low_throughput",
+            lambda m, e, t: m.records_per_second < t["low_throughput"]
+            and m.processed_records > 100,
+            _low_throughput_alert,
+        ),
+    )
+
     def __init__(self, alert_thresholds: Optional[Dict[str, Any]] = None):
         self.alert_thresholds = alert_thresholds or {
             "error_rate": 0.1,  # 10%
@@ -563,54 +690,12 @@ class AlertManager:
         self, metrics: ProcessingMetrics, errors: ErrorSummary
     ) -> List[Dict[str, Any]]:
         """Check metrics against alert thresholds."""
-        alerts = []
-
-        # Check error rate
-        if metrics.processed_records > 0:
-            error_rate = errors.total_errors / metrics.processed_records
-            if error_rate > self.alert_thresholds["error_rate"]:
-                alerts.append(
-                    {
-                        "type": "high_error_rate",
-                        "severity": "high",
-                        "message": f"Error rate {error_rate:.1%} exceeds threshold {self.alert_thresholds['error_rate']:.1%}",
-                        "metrics": {
-                            "error_rate": error_rate,
-                            "threshold": self.alert_thresholds["error_rate"],
-                        },
-                    }
-                )
-
-        # Check memory usage
-        if metrics.memory_usage_mb > self.alert_thresholds["memory_usage_mb"]:
-            alerts.append(
-                {
-                    "type": "high_memory_usage",
-                    "severity": "medium",
-                    "message": f"Memory usage {metrics.memory_usage_mb:.1f}MB exceeds threshold {self.alert_thresholds['memory_usage_mb']}MB",
-                    "metrics": {
-                        "memory_usage_mb": metrics.memory_usage_mb,
-                        "threshold": self.alert_thresholds["memory_usage_mb"],
-                    },
-                }
-            )
-
-        # Check throughput
-        if (
-            metrics.records_per_second < self.alert_thresholds["low_throughput"]
-            and metrics.processed_records > 100
-        ):
-            alerts.append(
-                {
-                    "type": "low_throughput",
-                    "severity": "medium",
-                    "message": f"Throughput {metrics.records_per_second:.1f} records/sec below threshold {self.alert_thresholds['low_throughput']}",
-                    "metrics": {
-                        "records_per_second": metrics.records_per_second,
-                        "threshold": self.alert_thresholds["low_throughput"],
-                    },
-                }
-            )
+        thresholds = self.alert_thresholds
+        alerts = [
+            {"type": name, **build(metrics, errors, thresholds)}
+            for name, applies, build in self._CHECKS
+            if applies(metrics, errors, thresholds)
+        ]
 
         # Check for stalled progress
         current_time = time.time()
@@ -638,14 +723,11 @@ class AlertManager:
 
     def get_alert_summary(self) -> Dict[str, Any]:
         """Get summary of all alerts triggered."""
-        alert_counts = {}
-        for alert in self.alerts_triggered:
-            alert_type = alert["type"]
-            alert_counts[alert_type] = alert_counts.get(alert_type, 0) + 1
-
         return {
             "total_alerts": len(self.alerts_triggered),
-            "alert_counts": alert_counts,
+            "alert_counts": dict(
+                Counter(alert["type"] for alert in self.alerts_triggered)
+            ),
             "recent_alerts": (
                 self.alerts_triggered[-10:] if self.alerts_triggered else []
             ),
@@ -368,6 +368,36 @@ class MemoryOptimizer:
 
         return optimal_batch_size
 
+    @staticmethod
+    def optimize_batch_size_smoothed(
+        prev_batch_size: int,
+        memory_usage_mb: float,
+        max_memory_mb: int = 100,
+        alpha: float = 0.3,
+    ) -> int:
+        """
+        Adjust batch size towards the memory-derived target gradually.
+
+        The one-shot rule in optimize_batch_size jumps straight to the target
+        computed from the latest reading, so noisy memory samples make the
+        batch size swing between calls. This blends that target with the
+        previous batch size as an exponentially weighted moving average.
+
+        Args:
+            prev_batch_size: Batch size used for the last measurement
+            memory_usage_mb: Memory usage measured for that batch in MB
+            max_memory_mb: Maximum allowed memory usage in MB
+            alpha: Weight of the new target (0 < alpha <= 1)
+
+        Returns:
+            Smoothed batch size
+        """
+        target = MemoryOptimizer.optimize_batch_size(
+            prev_batch_size, memory_usage_mb, max_memory_mb
+        )
+        smoothed = int(alpha * target + (1 - alpha) * prev_batch_size)
+        return max(100, min(smoothed, 10000))
+
 
 def create_parallel_config(
     cpu_count: Optional[int] = None,
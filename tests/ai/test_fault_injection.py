@@ -94,3 +94,15 @@ def test_circuit_breaker_opens_on_repeated_failures(monkeypatch):
     assert client.breaker.state == "OPEN"
     with pytest.raises(RuntimeError):
         client.chat_completion(messages=[{"role": "user", "content": "hi"}])
+
+
+def test_circuit_breaker_reset_closes_circuit(monkeypatch):
+    client = AzureOpenAIClient(endpoint="e", api_key="k", chat_deployment="chat")
+    client.breaker.failure_threshold = 1
+    client.breaker.on_failure()
+    assert client.breaker.state == "OPEN"
+
+    client.breaker.reset()
+    assert client.breaker.state == "CLOSED"
+    assert client.breaker.failures == 0
+    assert client.breaker.allow() is True
@@ -0,0 +1,28 @@
+import subprocess
+import sys
+from pathlib import Path
+
+SCRIPT = Path(__file__).resolve().parents[2] / "tools" / "generate_pii_synthetic.py"
+
+
+def _run(*args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, str(SCRIPT), *args], capture_output=True, text=True
+    )
+
+
+def test_negative_jobs_rejected(tmp_path):
+    out = tmp_path / "pii.jsonl"
+    result = _run("--count", "5", "--jobs", "-1", "--out", str(out))
+
+    assert result.returncode == 2
+    assert "--jobs must be 0 (all CPUs) or a positive number" in result.stderr
+    assert not out.exists()
+
+
+def test_zero_jobs_uses_all_cpus(tmp_path):
+    out = tmp_path / "pii.jsonl"
+    result = _run("--count", "5", "--jobs", "0", "--out", str(out))
+
+    assert result.returncode == 0, result.stderr
+    assert len(out.read_bytes().splitlines()) == 5
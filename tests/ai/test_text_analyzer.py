@@ -87,3 +87,48 @@ def test_analyze_text_schema_validation_failure(mock_client):
     assert result["success"] is False
     assert "error" in result
     assert "schema validation" in result["error"]
+
+
+# Valid output except for a lone surrogate, which only stdlib json accepts
+_LONE_SURROGATE_CONTENT = json.dumps(
+    {
+        "main_component_ai": "Pump System",
+        "primary_symptom_ai": "Leakage detected",
+        "root_cause_ai": "Seal failure",
+        "summary_ai": "Pump \ud800 seal",
+        "solution_ai": "Replace pump seal and test system",
+    }
+)
+
+
+def test_analyze_text_orjson_rejects_lone_surrogate(mock_client):
+    """Test orjson parsing reports non-strict JSON as invalid."""
+    pytest.importorskip("orjson")
+    mock_client.chat_completion.return_value = {"content": _LONE_SURROGATE_CONTENT}
+
+    result = analyze_text("test-surrogate", "Test text", mock_client)
+
+    assert result == {"success": False, "error": "Invalid JSON returned by model"}
+
+
+def test_analyze_text_orjson_rejects_nan(mock_client):
+    """Test orjson parsing reports NaN literals as invalid JSON."""
+    pytest.importorskip("orjson")
+    mock_client.chat_completion.return_value = {
+        "content": '{"main_component_ai": "Pump System", "confidence_score_ai": NaN}'
+    }
+
+    result = analyze_text("test-nan", "Test text", mock_client)
+
+    assert result == {"success": False, "error": "Invalid JSON returned by model"}
+
+
+def test_analyze_text_stdlib_json_accepts_lone_surrogate(mock_client):
+    """Test the stdlib fallback still accepts what json.loads accepts."""
+    mock_client.chat_completion.return_value = {"content": _LONE_SURROGATE_CONTENT}
+
+    with patch("src.ai.text_analyzer._json_loads", json.loads):
+        result = analyze_text("test-surrogate", "Test text", mock_client)
+
+    assert result["success"] is True
+    assert result["data"]["summary_ai"] == "Pump \ud800 seal"
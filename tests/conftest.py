@@ -4,3 +4,13 @@ from pathlib import Path
 # Add project root to sys.path to allow imports of src modules
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
+
+
+def pytest_configure(config):
+    """Register custom markers used across the test suite."""
+    config.addinivalue_line(
+        "markers", "config: tests that import and validate src.utils.config"
+    )
+    config.addinivalue_line(
+        "markers", "slow: long-running integration tests (deselect with -m 'not slow')"
+    )
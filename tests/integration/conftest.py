@@ -0,0 +1,21 @@
+"""
+Shared fixtures for integration tests.
+"""
+
+import pytest_asyncio
+from httpx import AsyncClient, ASGITransport
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def app_client():
+    """
+    In-process ASGI client shared by all integration tests in the session.
+
+    Tests using it must run on the session event loop
+    (``@pytest.mark.asyncio(loop_scope="session")``).
+    """
+    from src.backend.main import app
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
@@ -3,22 +3,100 @@ Backend API Integration Tests
 Tests integration between frontend and backend APIs
 """
 
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
 import pytest
-from fastapi.testclient import TestClient
-from unittest.mock import Mock, patch, MagicMock
+import pytest_asyncio
+
 from src.backend.services.chat_service import ChatResponse
 
+# All tests share the session-scoped app_client, so they must share its event loop
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+# Pre-serialized chat request bodies, posted with content= to skip json encoding
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_POWERING_ON_QUERY = b'{"query":"Equipment not powering on"}'
+_EMPTY_QUERY = b'{"query":""}'
+_LONG_QUERY = b'{"query":"' + b"x" * 1000 + b'"}'
+_TEST_FAULT_QUERY = b'{"query":"Test fault"}'
+_INVALID_KEY_BODY = b'{"invalid_key":"value"}'
+_POWER_QUERY = b'{"query":"power supply issue"}'
+
+# Canned chat results; model_construct skips re-validating the literal fields
+_POWER_SUPPLY_CHAT_RESPONSE = ChatResponse.model_construct(
+    success=True,
+    query="Equipment not powering on",
+    response="Based on analysis, this is a power supply issue.",
+    context_count=3,
+    sources=[],
+    metadata={
+        "fault_code": "PWR-001",
+        "component": "Power Supply Module",
+        "summary": "Voltage fluctuation detected.",
+        "resolution_steps": [
+            "Measure voltage output levels",
+            "Check for loose connections",
+            "Replace faulty capacitors",
+        ],
+    },
+)
+_WORKFLOW_CHAT_RESPONSE = ChatResponse.model_construct(
+    success=True,
+    query="power supply issue",
+    response="Diagnosis result",
+    context_count=1,
+    sources=[],
+    metadata={
+        "fault_code": "TEST-001",
+        "component": "Test Component",
+        "resolution_steps": ["Step 1", "Step 2"],
+    },
+)
+
+
+@pytest.fixture(scope="module")
+def analytics_instance():
+    """Analytics service stub returning deterministic summary data"""
+    mock_analytics_instance = SimpleNamespace()
+
+    async def async_get_date_range():
+        return {"min_date": "2024-01-01", "max_date": "2024-12-31"}
+
+    async def async_get_equipment_list():
+        return ["EQ-001", "EQ-002", "EQ-003"]
+
+    async def async_calculate_mtbf(limit=5):
+        return [{"month": "2024-01", "mtbf": 70.5}, {"month": "2024-02", "mtbf": 72.3}]
+
+    async def async_calculate_pareto(limit=5):
+        return [{"component": "Power Supply", "count": 45}, {"component": "Display", "count": 32}]
+
+    mock_analytics_instance.get_date_range = async_get_date_range
+    mock_analytics_instance.get_equipment_list = async_get_equipment_list
+    mock_analytics_instance.calculate_mtbf = async_calculate_mtbf
+    mock_analytics_instance.calculate_pareto = async_calculate_pareto
+
+    return mock_analytics_instance
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def summary_response(app_client, analytics_instance):
+    """
+    Perform GET /api/analytics/summary once and share the response.
+
+    The summary endpoint is idempotent under the stubbed service, so tests that
+    only inspect the response can reuse it instead of issuing their own request.
+    """
+    with patch("src.backend.api.analytics.AnalyticsService") as mock_analytics_service:
+        mock_analytics_service.return_value = analytics_instance
+        return await app_client.get("/api/analytics/summary")
+
 
 class TestAPIIntegration:
     """API integration tests for backend endpoints"""
 
-    @pytest.fixture
-    def client(self):
-        """Create a test client for the FastAPI app"""
-        from src.backend.main import app
-
-        return TestClient(app)
-
     @pytest.fixture
     def mock_db_session(self):
         """Mock database session"""
@@ -45,9 +123,9 @@ class TestAPIIntegration:
 
     # ==================== Health API Tests ====================
 
-    def test_health_check(self, client):
+    async def test_health_check(self, app_client):
         """Test health check endpoint"""
-        response = client.get("/api/health")
+        response = await app_client.get("/api/health")
 
         assert response.status_code == 200
         data = response.json()
@@ -55,34 +133,18 @@ class TestAPIIntegration:
 
     # ==================== Chat API Tests (AC: 2) ====================
 
-    def test_chat_diagnose_endpoint(self, client, mock_chat_service):
+    async def test_chat_diagnose_endpoint(self, app_client, mock_chat_service):
         """Test chat diagnosis endpoint integration"""
         # Mock AI service response
-        mock_chat_instance = Mock()
+        mock_chat_instance = SimpleNamespace()
         # Create an async mock that returns a ChatResponse
         async def async_chat_return(request):
-            return ChatResponse(
-                success=True,
-                query="Equipment not powering on",
-                response="Based on analysis, this is a power supply issue.",
-                context_count=3,
-                sources=[],
-                metadata={
-                    "fault_code": "PWR-001",
-                    "component": "Power Supply Module",
-                    "summary": "Voltage fluctuation detected.",
-                    "resolution_steps": [
-                        "Measure voltage output levels",
-                        "Check for loose connections",
-                        "Replace faulty capacitors",
-                    ]
-                }
-            )
+            return _POWER_SUPPLY_CHAT_RESPONSE
         mock_chat_instance.chat = async_chat_return
         mock_chat_service.return_value = mock_chat_instance
 
-        response = client.post(
-            "/api/chat/", json={"query": "Equipment not powering on"}
+        response = await app_client.post(
+            "/api/chat/", content=_POWERING_ON_QUERY, headers=_JSON_HEADERS
         )
 
         assert response.status_code == 200
@@ -91,26 +153,29 @@ class TestAPIIntegration:
         assert "response" in data
         assert "power supply" in data["response"].lower()
 
-    def test_chat_diagnose_with_empty_query(self, client):
+    async def test_chat_diagnose_with_empty_query(self, app_client):
         """Test chat diagnosis with empty query"""
-        response = client.post("/api/chat/", json={"query": ""})
+        response = await app_client.post(
+            "/api/chat/", content=_EMPTY_QUERY, headers=_JSON_HEADERS
+        )
 
         assert response.status_code == 422  # Validation error
 
-    def test_chat_diagnose_with_long_query(self, client):
+    async def test_chat_diagnose_with_long_query(self, app_client):
         """Test chat diagnosis with long query"""
-        long_query = "x" * 1000
-        response = client.post("/api/chat/", json={"query": long_query})
+        response = await app_client.post(
+            "/api/chat/", content=_LONG_QUERY, headers=_JSON_HEADERS
+        )
 
         # Should handle or reject based on validation
         assert response.status_code in [200, 422]
 
     # ==================== Search API Tests (AC: 2) ====================
 
-    def test_search_similar_cases(self, client, mock_search_service):
+    async def test_search_similar_cases(self, app_client, mock_search_service):
         """Test search for similar cases endpoint"""
         # Mock search service response
-        mock_search_instance = Mock()
+        mock_search_instance = SimpleNamespace()
         async def async_hybrid_search(query, limit=10, **kwargs):
             return {
                 "success": True,
@@ -132,24 +197,24 @@ class TestAPIIntegration:
         mock_search_instance.hybrid_search = async_hybrid_search
         mock_search_service.return_value = mock_search_instance
 
-        response = client.get("/api/search/", params={"query": "power supply"})
+        response = await app_client.get("/api/search/", params={"query": "power supply"})
 
         assert response.status_code == 200
         data = response.json()
         assert data["success"] is True
         assert len(data["results"]) == 2
 
-    def test_search_with_empty_query(self, client):
+    async def test_search_with_empty_query(self, app_client):
         """Test search with empty query"""
-        response = client.get("/api/search/", params={"query": ""})
+        response = await app_client.get("/api/search/", params={"query": ""})
 
         # Should return empty results or validation error
         assert response.status_code in [200, 422]
 
-    def test_search_with_no_results(self, client, mock_search_service):
+    async def test_search_with_no_results(self, app_client, mock_search_service):
         """Test search with no matching results"""
         # Mock empty search service response
-        mock_search_instance = Mock()
+        mock_search_instance = SimpleNamespace()
         async def async_hybrid_search(query, limit=10, **kwargs):
             return {
                 "success": True,
@@ -158,7 +223,7 @@ class TestAPIIntegration:
         mock_search_instance.hybrid_search = async_hybrid_search
         mock_search_service.return_value = mock_search_instance
 
-        response = client.get(
+        response = await app_client.get(
             "/api/search/", params={"query": "unique nonexistent query"}
         )
 
@@ -169,41 +234,17 @@ class TestAPIIntegration:
 
     # ==================== Analytics API Tests (AC: 2) ====================
 
-    def test_analytics_summary(self, client, mock_analytics_service):
+    async def test_analytics_summary(self, summary_response):
         """Test analytics summary endpoint"""
-        # Mock analytics service responses
-        mock_analytics_instance = Mock()
-
-        async def async_get_date_range():
-            return {"min_date": "2024-01-01", "max_date": "2024-12-31"}
-
-        async def async_get_equipment_list():
-            return ["EQ-001", "EQ-002", "EQ-003"]
-
-        async def async_calculate_mtbf(limit=5):
-            return [{"month": "2024-01", "mtbf": 70.5}, {"month": "2024-02", "mtbf": 72.3}]
-
-        async def async_calculate_pareto(limit=5):
-            return [{"component": "Power Supply", "count": 45}, {"component": "Display", "count": 32}]
-
-        mock_analytics_instance.get_date_range = async_get_date_range
-        mock_analytics_instance.get_equipment_list = async_get_equipment_list
-        mock_analytics_instance.calculate_mtbf = async_calculate_mtbf
-        mock_analytics_instance.calculate_pareto = async_calculate_pareto
-
-        mock_analytics_service.return_value = mock_analytics_instance
-
-        response = client.get("/api/analytics/summary")
-
-        assert response.status_code == 200
-        data = response.json()
+        assert summary_response.status_code == 200
+        data = summary_response.json()
         assert data["success"] is True
         assert "date_range" in data["data"]
 
-    def test_analytics_with_invalid_date_range(self, client, mock_analytics_service):
+    async def test_analytics_with_invalid_date_range(self, app_client, mock_analytics_service):
         """Test analytics with invalid date range"""
         # Mock analytics service
-        mock_analytics_instance = Mock()
+        mock_analytics_instance = SimpleNamespace()
 
         async def async_calculate_mtbf(start_date=None, end_date=None, equipment_id=None, component=None):
             # 如果日期范围无效，应该返回空数据或错误
@@ -223,7 +264,7 @@ class TestAPIIntegration:
         mock_analytics_service.side_effect = lambda db: mock_analytics_instance
 
         # Test MTBF endpoint with invalid date range
-        response = client.get(
+        response = await app_client.get(
             "/api/analytics/mtbf",
             params={
                 "start_date": "2024-12-31",
@@ -240,10 +281,10 @@ class TestAPIIntegration:
             # 如果返回200，数据应该为空或包含错误信息
             assert data["success"] is True or "error" in data
 
-    def test_analytics_mtbf(self, client, mock_analytics_service):
+    async def test_analytics_mtbf(self, app_client, mock_analytics_service):
         """Test MTBF analytics endpoint"""
         # Create a mock instance that will be returned when AnalyticsService is instantiated
-        mock_analytics_instance = Mock()
+        mock_analytics_instance = SimpleNamespace()
 
         async def async_calculate_mtbf(start_date=None, end_date=None, equipment_id=None, component=None):
             return [
@@ -261,7 +302,7 @@ class TestAPIIntegration:
         # Configure the AnalyticsService mock to return our instance when called
         mock_analytics_service.side_effect = lambda db: mock_analytics_instance
 
-        response = client.get(
+        response = await app_client.get(
             "/api/analytics/mtbf",
             params={"start_date": "2024-01-01", "end_date": "2024-03-31"},
         )
@@ -271,10 +312,10 @@ class TestAPIIntegration:
         assert data["success"] is True
         assert len(data["data"]) > 0
 
-    def test_analytics_pareto(self, client, mock_analytics_service):
+    async def test_analytics_pareto(self, app_client, mock_analytics_service):
         """Test Pareto analytics endpoint"""
         # Create a mock instance that will be returned when AnalyticsService is instantiated
-        mock_analytics_instance = Mock()
+        mock_analytics_instance = SimpleNamespace()
 
         async def async_calculate_pareto(start_date=None, end_date=None, limit=10):
             return [
@@ -292,7 +333,7 @@ class TestAPIIntegration:
         # Configure the AnalyticsService mock to return our instance when called
         mock_analytics_service.side_effect = lambda db: mock_analytics_instance
 
-        response = client.get(
+        response = await app_client.get(
             "/api/analytics/pareto",
             params={"start_date": "2024-01-01", "end_date": "2024-12-31"},
         )
@@ -302,46 +343,21 @@ class TestAPIIntegration:
         assert data["success"] is True
         assert len(data["data"]) > 0
 
-    def test_analytics_fault_distribution(self, client, mock_analytics_service):
+    async def test_analytics_fault_distribution(self, summary_response):
         """Test fault distribution analytics endpoint"""
         # 由于 /api/analytics/fault-distribution 端点可能不存在，
         # 我们改为测试一个存在的端点，比如 /api/analytics/summary
-        # Mock analytics service
-        mock_analytics_instance = Mock()
-
-        async def async_get_date_range():
-            return {"min_date": "2024-01-01", "max_date": "2024-12-31"}
-
-        async def async_get_equipment_list():
-            return ["EQ-001", "EQ-002", "EQ-003"]
-
-        async def async_calculate_mtbf(limit=5):
-            return [{"month": "2024-01", "mtbf": 70.5}, {"month": "2024-02", "mtbf": 72.3}]
-
-        async def async_calculate_pareto(limit=5):
-            return [{"component": "Power Supply", "count": 45}, {"component": "Display", "count": 32}]
-
-        mock_analytics_instance.get_date_range = async_get_date_range
-        mock_analytics_instance.get_equipment_list = async_get_equipment_list
-        mock_analytics_instance.calculate_mtbf = async_calculate_mtbf
-        mock_analytics_instance.calculate_pareto = async_calculate_pareto
-
-        mock_analytics_service.return_value = mock_analytics_instance
-
-        # 测试 /api/analytics/summary 端点
-        response = client.get("/api/analytics/summary")
-
-        assert response.status_code == 200
-        data = response.json()
+        assert summary_response.status_code == 200
+        data = summary_response.json()
         assert data["success"] is True
         assert "data" in data
 
     # ==================== Error Handling Tests (AC: 3) ====================
 
-    def test_database_connection_error(self, client, mock_analytics_service):
+    async def test_database_connection_error(self, app_client, mock_analytics_service):
         """Test handling of database connection errors"""
         # Mock analytics service to raise database error
-        mock_analytics_instance = Mock()
+        mock_analytics_instance = SimpleNamespace()
 
         async def async_get_date_range():
             raise Exception("Database connection failed")
@@ -354,72 +370,58 @@ class TestAPIIntegration:
         # Configure the AnalyticsService mock to return our instance when called
         mock_analytics_service.side_effect = lambda db: mock_analytics_instance
 
-        response = client.get("/api/analytics/summary")
+        response = await app_client.get("/api/analytics/summary")
 
         # Should return 500 error with appropriate message
         assert response.status_code == 500
 
-    def test_ai_service_unavailable(self, client, mock_chat_service):
+    async def test_ai_service_unavailable(self, app_client, mock_chat_service):
         """Test handling of AI service being unavailable"""
         # Mock chat service to raise error
-        mock_chat_instance = Mock()
+        mock_chat_instance = SimpleNamespace()
         async def async_chat_error(request):
             raise Exception("AI service unavailable")
         mock_chat_instance.chat = async_chat_error
         mock_chat_service.return_value = mock_chat_instance
 
-        response = client.post("/api/chat/", json={"query": "Test fault"})
+        response = await app_client.post(
+            "/api/chat/", content=_TEST_FAULT_QUERY, headers=_JSON_HEADERS
+        )
 
         # Should return 500 error
         assert response.status_code in [500, 503]
 
-    def test_malformed_request_body(self, client):
+    async def test_malformed_request_body(self, app_client):
         """Test handling of malformed request body"""
-        response = client.post("/api/chat/", json={"invalid_key": "value"})
+        response = await app_client.post(
+            "/api/chat/", content=_INVALID_KEY_BODY, headers=_JSON_HEADERS
+        )
 
         # Should return 422 validation error
         assert response.status_code == 422
 
-    def test_missing_required_parameters(self, client):
+    async def test_missing_required_parameters(self, app_client):
         """Test handling of missing required parameters"""
         # Test an endpoint that actually requires parameters
         # For example, search endpoint requires query parameter
-        response = client.get("/api/search/")
+        response = await app_client.get("/api/search/")
 
         # Should return 422 validation error for missing query parameter
         assert response.status_code == 422
 
     # ==================== Performance Tests (AC: 4) ====================
 
-    def test_api_response_time(self, client, mock_analytics_service):
+    async def test_api_response_time(
+        self, app_client, mock_analytics_service, analytics_instance
+    ):
         """Test API response time meets performance requirements"""
         import time
 
-        # Mock analytics service
-        mock_analytics_instance = Mock()
-
-        async def async_get_date_range():
-            return {"min_date": "2024-01-01", "max_date": "2024-12-31"}
-
-        async def async_get_equipment_list():
-            return ["EQ-001", "EQ-002", "EQ-003"]
-
-        async def async_calculate_mtbf(limit=5):
-            return [{"month": "2024-01", "mtbf": 70.5}, {"month": "2024-02", "mtbf": 72.3}]
-
-        async def async_calculate_pareto(limit=5):
-            return [{"component": "Power Supply", "count": 45}, {"component": "Display", "count": 32}]
-
-        mock_analytics_instance.get_date_range = async_get_date_range
-        mock_analytics_instance.get_equipment_list = async_get_equipment_list
-        mock_analytics_instance.calculate_mtbf = async_calculate_mtbf
-        mock_analytics_instance.calculate_pareto = async_calculate_pareto
-
-        mock_analytics_service.return_value = mock_analytics_instance
+        mock_analytics_service.return_value = analytics_instance
 
         start_time = time.time()
 
-        response = client.get("/api/analytics/summary")
+        response = await app_client.get("/api/analytics/summary")
 
         end_time = time.time()
         response_time_ms = (end_time - start_time) * 1000
@@ -428,50 +430,24 @@ class TestAPIIntegration:
         # API should respond within reasonable time (e.g., 1 second)
         assert response_time_ms < 1000
 
-    def test_concurrent_requests(self, client, mock_analytics_service):
+    async def test_concurrent_requests(
+        self, app_client, mock_analytics_service, analytics_instance
+    ):
         """Test handling of concurrent requests"""
-        import threading
-
-        # Mock analytics service
-        mock_analytics_instance = Mock()
-
-        async def async_get_date_range():
-            return {"min_date": "2024-01-01", "max_date": "2024-12-31"}
-
-        async def async_get_equipment_list():
-            return ["EQ-001", "EQ-002", "EQ-003"]
-
-        async def async_calculate_mtbf(limit=5):
-            return [{"month": "2024-01", "mtbf": 70.5}, {"month": "2024-02", "mtbf": 72.3}]
-
-        async def async_calculate_pareto(limit=5):
-            return [{"component": "Power Supply", "count": 45}, {"component": "Display", "count": 32}]
-
-        mock_analytics_instance.get_date_range = async_get_date_range
-        mock_analytics_instance.get_equipment_list = async_get_equipment_list
-        mock_analytics_instance.calculate_mtbf = async_calculate_mtbf
-        mock_analytics_instance.calculate_pareto = async_calculate_pareto
-
-        mock_analytics_service.return_value = mock_analytics_instance
+        mock_analytics_service.return_value = analytics_instance
 
         results = []
         errors = []
 
-        def make_request():
+        async def make_request():
             try:
-                response = client.get("/api/analytics/summary")
+                response = await app_client.get("/api/analytics/summary")
                 results.append(response.status_code)
             except Exception as e:
                 errors.append(str(e))
 
-        # Create 5 concurrent threads (reduced from 10 for stability)
-        threads = [threading.Thread(target=make_request) for _ in range(5)]
-
-        for thread in threads:
-            thread.start()
-
-        for thread in threads:
-            thread.join()
+        # Issue 5 concurrent requests (reduced from 10 for stability)
+        await asyncio.gather(*(make_request() for _ in range(5)))
 
         # All requests should succeed
         assert len(errors) == 0
@@ -480,12 +456,12 @@ class TestAPIIntegration:
 
     # ==================== Integration Workflow Tests ====================
 
-    def test_complete_diagnostic_workflow(
-        self, client, mock_chat_service, mock_search_service
+    async def test_complete_diagnostic_workflow(
+        self, app_client, mock_chat_service, mock_search_service
     ):
         """Test complete diagnostic workflow: search + diagnose"""
         # Mock search result
-        mock_search_instance = Mock()
+        mock_search_instance = SimpleNamespace()
         async def async_hybrid_search(query, limit=10, **kwargs):
             return {
                 "success": True,
@@ -502,32 +478,21 @@ class TestAPIIntegration:
         mock_search_service.return_value = mock_search_instance
 
         # Mock chat diagnosis
-        mock_chat_instance = Mock()
+        mock_chat_instance = SimpleNamespace()
         async def async_chat_return(request):
-            return ChatResponse(
-                success=True,
-                query="power supply issue",
-                response="Diagnosis result",
-                context_count=1,
-                sources=[],
-                metadata={
-                    "fault_code": "TEST-001",
-                    "component": "Test Component",
-                    "resolution_steps": ["Step 1", "Step 2"],
-                }
-            )
+            return _WORKFLOW_CHAT_RESPONSE
         mock_chat_instance.chat = async_chat_return
         mock_chat_service.return_value = mock_chat_instance
 
         # Step 1: Search for similar cases
-        search_response = client.get(
+        search_response = await app_client.get(
             "/api/search/", params={"query": "power supply issue"}
         )
         assert search_response.status_code == 200
 
         # Step 2: Get diagnosis
-        diagnosis_response = client.post(
-            "/api/chat/", json={"query": "power supply issue"}
+        diagnosis_response = await app_client.post(
+            "/api/chat/", content=_POWER_QUERY, headers=_JSON_HEADERS
         )
         assert diagnosis_response.status_code == 200
 
@@ -535,10 +500,12 @@ class TestAPIIntegration:
         assert data["success"] is True
         assert "response" in data
 
-    def test_complete_analytics_workflow(self, client, mock_analytics_service):
+    async def test_complete_analytics_workflow(
+        self, app_client, mock_analytics_service, summary_response
+    ):
         """Test complete analytics dashboard workflow"""
         # Mock analytics service
-        mock_analytics_instance = Mock()
+        mock_analytics_instance = SimpleNamespace()
 
         async def async_get_date_range():
             return {"min_date": "2024-01-01", "max_date": "2024-12-31"}
@@ -567,19 +534,18 @@ class TestAPIIntegration:
 
         mock_analytics_service.return_value = mock_analytics_instance
 
-        # Step 1: Get summary
-        summary_response = client.get("/api/analytics/summary")
+        # Step 1: Get summary (shared module-level response)
         assert summary_response.status_code == 200
 
         # Step 2: Get MTBF
-        mtbf_response = client.get(
+        mtbf_response = await app_client.get(
             "/api/analytics/mtbf",
             params={"start_date": "2024-01-01", "end_date": "2024-12-31"},
         )
         assert mtbf_response.status_code == 200
 
         # Step 3: Get Pareto
-        pareto_response = client.get(
+        pareto_response = await app_client.get(
             "/api/analytics/pareto",
             params={"start_date": "2024-01-01", "end_date": "2024-12-31"},
         )
@@ -588,5 +554,4 @@ class TestAPIIntegration:
         # Step 4: Get fault distribution - 这个端点可能不存在，跳过或修改测试
         # 由于我们之前发现这个端点可能不存在，我们跳过这个步骤
         # 或者我们可以测试一个存在的端点，比如再次测试summary
-        summary_response2 = client.get("/api/analytics/summary")
-        assert summary_response2.status_code == 200
+        assert summary_response.json()["success"] is True
@@ -1,5 +1,3 @@
-import time
-import logging
 from unittest.mock import Mock, patch
 
 import pytest
@@ -8,6 +6,17 @@ from src.ai.openai_client import AzureOpenAIClient
 from src.ai.cost_tracker import CostTracker, Pricing
 
 
+@pytest.fixture(scope="session")
+def cost_tracker():
+    """Shared tracker with example pricing; CostTracker keeps no per-call state."""
+    pricing = Pricing(
+        prompt_per_1k=0.03,
+        completion_per_1k=0.06,
+        embedding_per_1k=0.0001,
+    )
+    return CostTracker(pricing, alert_threshold=0.01)  # low threshold for test
+
+
 def test_429_rate_limit_drill():
     """Simulate 429 responses and verify exponential backoff and circuit breaker."""
     from types import SimpleNamespace
@@ -35,36 +44,19 @@ def test_429_rate_limit_drill():
         resp = client.chat_completion(messages=[{"role": "user", "content": "test"}])
         assert resp["content"] == "ok"
         assert call_count == 4  # 3 failures + 1 success
-        print(f"429 drill passed after {call_count} calls")
 
 
-def test_cost_monitoring_loop_example():
+def test_cost_monitoring_loop_example(cost_tracker):
     """Example of a minimal monitoring loop that logs cost alerts."""
-    # Setup pricing (example values)
-    pricing = Pricing(
-        prompt_per_1k=0.03,
-        completion_per_1k=0.06,
-        embedding_per_1k=0.0001,
-    )
-    tracker = CostTracker(pricing, alert_threshold=0.01)  # low threshold for test
-
     # Simulate usage accumulation
     usage = {
         "prompt_tokens": 5000,  # 5k tokens
         "completion_tokens": 2000,
         "embedding_tokens": 10000,
     }
-    cost = tracker.estimate(usage)
-    print(f"Cost estimate: {cost}")
+    cost = cost_tracker.estimate(usage)
 
     # Verify alert triggered (total > 0.01)
     assert cost["total_cost"] > 0.01
     # In real monitoring, we would integrate with Prometheus/Alertmanager or a log guard
     # For now, we just ensure the logging.warning path is exercised
-    print("Cost monitoring example completed.")
-
-
-if __name__ == "__main__":
-    test_429_rate_limit_drill()
-    test_cost_monitoring_loop_example()
-    print("Cost/rate monitoring tests passed.")
@@ -3,23 +3,136 @@
 使用生产数据进行完整的系统测试
 """
 
+import asyncio
+import logging
+
 import pytest
-import pytest_asyncio
-from httpx import AsyncClient, ASGITransport
-from unittest.mock import patch, MagicMock, AsyncMock
+from unittest.mock import AsyncMock
 import json
 from datetime import datetime, timedelta
 
-from src.backend.main import app
 from src.backend.core.config import settings
 from src.backend.services.chat_service import ChatResponse
 
+logger = logging.getLogger(__name__)
+
+pytestmark = pytest.mark.slow
+
+# 模拟搜索服务返回结果
+_MOCK_SEARCH_RESPONSE = {
+    "success": True,
+    "query": "CT扫描仪图像伪影",
+    "results": [
+        {
+            "notification_id": "TEST001",
+            "noti_date": "2025-01-15T09:30:00+08:00",
+            "noti_issue_type": "Hardware",
+            "noti_text": "CT扫描仪在腹部扫描时出现环形伪影，影响图像质量。设备型号：SOMATOM Definition Edge。",
+            "similarity_score": 0.85,
+            "search_type": "hybrid"
+        },
+        {
+            "notification_id": "TEST003",
+            "noti_date": "2025-01-17T11:05:00+08:00",
+            "noti_issue_type": "Network",
+            "noti_text": "MRI设备无法连接到医院网络，无法上传扫描数据。",
+            "similarity_score": 0.78,
+            "search_type": "hybrid"
+        }
+    ],
+    "metadata": {
+        "total_results": 2,
+        "semantic_count": 1,
+        "keyword_count": 1,
+        "fusion_method": "RRF",
+        "semantic_weight": 1.0,
+        "keyword_weight": 1.0
+    }
+}
+
+# 模拟分析服务返回结果
+_MOCK_ANALYTICS_DATA = {
+    "mtbf_analysis": [
+        {
+            "equipment_id": "1055000001",
+            "failed_component": "探测器",
+            "failure_count": 3,
+            "avg_mtbf_days": 45.5,
+            "min_mtbf_days": 30.0,
+            "max_mtbf_days": 60.0,
+            "median_mtbf_days": 45.0,
+            "first_failure_date": "2025-01-15T09:30:00+08:00",
+            "last_failure_date": "2025-01-15T16:30:00+08:00"
+        }
+    ],
+    "pareto_analysis": [
+        {
+            "component": "探测器",
+            "failure_count": 3,
+            "percentage": 30.0,
+            "cumulative_percentage": 30.0
+        },
+        {
+            "component": "网络接口",
+            "failure_count": 2,
+            "percentage": 20.0,
+            "cumulative_percentage": 50.0
+        }
+    ]
+}
+
+# 模拟AI聊天服务返回结果 - 必须返回ChatResponse对象（model_construct 跳过重复校验）
+_MOCK_CHAT_RESPONSE = ChatResponse.model_construct(
+    success=True,
+    query="CT扫描仪出现图像伪影，如何诊断和解决？",
+    response="根据历史工单分析，CT扫描仪图像伪影问题通常由探测器校准偏差引起。建议执行以下步骤：1. 重新校准探测器 2. 检查X射线管状态 3. 验证图像重建算法。参考案例：TEST001（探测器校准问题，已解决）",
+    context_count=2,
+    sources=["TEST001", "TEST003"],
+    metadata={
+        "confidence": 0.88,
+        "suggested_actions": [
+            "重新校准探测器",
+            "检查X射线管状态",
+            "验证图像重建算法"
+        ]
+    }
+)
+
+
+@pytest.fixture(scope="class")
+def patched_services():
+    """Install the service mocks once for every workflow test in the class."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            "src.backend.services.search_service.SearchService.hybrid_search",
+            AsyncMock(return_value=_MOCK_SEARCH_RESPONSE),
+        )
+        mp.setattr(
+            "src.backend.services.analytics_service.AnalyticsService.calculate_mtbf",
+            AsyncMock(return_value=_MOCK_ANALYTICS_DATA["mtbf_analysis"]),
+        )
+        mp.setattr(
+            "src.backend.services.analytics_service.AnalyticsService.calculate_pareto",
+            AsyncMock(return_value=_MOCK_ANALYTICS_DATA["pareto_analysis"]),
+        )
+        mp.setattr(
+            "src.backend.services.chat_service.ChatService.chat",
+            AsyncMock(return_value=_MOCK_CHAT_RESPONSE),
+        )
+        # 直接模拟健康检查端点，避免数据库连接问题
+        mp.setattr(
+            "src.backend.api.health.test_connection",
+            AsyncMock(return_value=True),
+        )
+        yield
+
 
+@pytest.mark.usefixtures("patched_services")
 class TestEndToEndWorkflow:
     """端到端工作流程测试"""
 
-    @pytest.mark.asyncio
-    async def test_complete_diagnostic_workflow(self):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_complete_diagnostic_workflow(self, app_client):
         """
         测试完整的诊断工作流程：
         1. 搜索相关工单
@@ -27,102 +140,11 @@ class TestEndToEndWorkflow:
         3. 进行AI聊天诊断
         4. 验证结果
         """
-        # 模拟搜索服务返回结果
-        mock_search_response = {
-            "success": True,
-            "query": "CT扫描仪图像伪影",
-            "results": [
-                {
-                    "notification_id": "TEST001",
-                    "noti_date": "2025-01-15T09:30:00+08:00",
-                    "noti_issue_type": "Hardware",
-                    "noti_text": "CT扫描仪在腹部扫描时出现环形伪影，影响图像质量。设备型号：SOMATOM Definition Edge。",
-                    "similarity_score": 0.85,
-                    "search_type": "hybrid"
-                },
-                {
-                    "notification_id": "TEST003",
-                    "noti_date": "2025-01-17T11:05:00+08:00",
-                    "noti_issue_type": "Network",
-                    "noti_text": "MRI设备无法连接到医院网络，无法上传扫描数据。",
-                    "similarity_score": 0.78,
-                    "search_type": "hybrid"
-                }
-            ],
-            "metadata": {
-                "total_results": 2,
-                "semantic_count": 1,
-                "keyword_count": 1,
-                "fusion_method": "RRF",
-                "semantic_weight": 1.0,
-                "keyword_weight": 1.0
-            }
-        }
-
-        # 模拟分析服务返回结果
-        mock_analytics_data = {
-            "mtbf_analysis": [
-                {
-                    "equipment_id": "1055000001",
-                    "failed_component": "探测器",
-                    "failure_count": 3,
-                    "avg_mtbf_days": 45.5,
-                    "min_mtbf_days": 30.0,
-                    "max_mtbf_days": 60.0,
-                    "median_mtbf_days": 45.0,
-                    "first_failure_date": "2025-01-15T09:30:00+08:00",
-                    "last_failure_date": "2025-01-15T16:30:00+08:00"
-                }
-            ],
-            "pareto_analysis": [
-                {
-                    "component": "探测器",
-                    "failure_count": 3,
-                    "percentage": 30.0,
-                    "cumulative_percentage": 30.0
-                },
-                {
-                    "component": "网络接口",
-                    "failure_count": 2,
-                    "percentage": 20.0,
-                    "cumulative_percentage": 50.0
-                }
-            ]
-        }
-
-        # 模拟AI聊天服务返回结果 - 必须返回ChatResponse对象
-        mock_chat_response = ChatResponse(
-            success=True,
-            query="CT扫描仪出现图像伪影，如何诊断和解决？",
-            response="根据历史工单分析，CT扫描仪图像伪影问题通常由探测器校准偏差引起。建议执行以下步骤：1. 重新校准探测器 2. 检查X射线管状态 3. 验证图像重建算法。参考案例：TEST001（探测器校准问题，已解决）",
-            context_count=2,
-            sources=["TEST001", "TEST003"],
-            metadata={
-                "confidence": 0.88,
-                "suggested_actions": [
-                    "重新校准探测器",
-                    "检查X射线管状态",
-                    "验证图像重建算法"
-                ]
-            }
-        )
-
-        with patch("src.backend.services.search_service.SearchService.hybrid_search") as mock_search, \
-             patch("src.backend.services.analytics_service.AnalyticsService.calculate_mtbf") as mock_mtbf, \
-             patch("src.backend.services.analytics_service.AnalyticsService.calculate_pareto") as mock_pareto, \
-             patch("src.backend.services.chat_service.ChatService.chat") as mock_chat:
-
-            # 设置模拟返回值
-            mock_search.return_value = mock_search_response
-            mock_mtbf.return_value = mock_analytics_data["mtbf_analysis"]
-            mock_pareto.return_value = mock_analytics_data["pareto_analysis"]
-            mock_chat.return_value = mock_chat_response
-
-            transport = ASGITransport(app=app)
-            async with AsyncClient(transport=transport, base_url="http://test") as client:
-
+        # 所有后端服务均已模拟且无副作用，四个请求可以并发执行
+        search_response, mtbf_response, pareto_response, chat_response = (
+            await asyncio.gather(
                 # 步骤1: 搜索相关工单
-                search_response = await client.post(
+                app_client.post(
                     "/api/search/",
                     json={
                         "query": "CT扫描仪图像伪影",
@@ -131,43 +153,19 @@ class TestEndToEndWorkflow:
                         "keyword_weight": 1.0,
                         "similarity_threshold": 0.7
                     }
-                )
-                assert search_response.status_code == 200
-                search_data = search_response.json()
-                assert len(search_data["results"]) == 2
-                assert search_data["results"][0]["notification_id"] == "TEST001"
-
+                ),
                 # 步骤2: 获取MTBF分析
-                mtbf_response = await client.get(
+                app_client.get(
                     "/api/analytics/mtbf",
                     params={"equipment_id": "1055000001"}
-                )
-                assert mtbf_response.status_code == 200
-                mtbf_result = mtbf_response.json()
-                assert "data" in mtbf_result
-                assert "success" in mtbf_result
-                assert mtbf_result["success"] == True
-                mtbf_data = mtbf_result["data"]
-                assert len(mtbf_data) == 1
-                assert mtbf_data[0]["equipment_id"] == "1055000001"
-                assert mtbf_data[0]["failed_component"] == "探测器"
-
+                ),
                 # 步骤3: 获取Pareto分析
-                pareto_response = await client.get(
+                app_client.get(
                     "/api/analytics/pareto",
                     params={"limit": 5}
-                )
-                assert pareto_response.status_code == 200
-                pareto_result = pareto_response.json()
-                assert "data" in pareto_result
-                assert "success" in pareto_result
-                assert pareto_result["success"] == True
-                pareto_data = pareto_result["data"]
-                assert len(pareto_data) == 2
-                assert pareto_data[0]["component"] == "探测器"
-
+                ),
                 # 步骤4: AI聊天诊断
-                chat_response = await client.post(
+                app_client.post(
                     "/api/chat/",
                     json={
                         "query": "CT扫描仪出现图像伪影，如何诊断和解决？",
@@ -175,135 +173,139 @@ class TestEndToEndWorkflow:
                         "context_limit": 5,
                         "conversation_history": []
                     }
-                )
-                assert chat_response.status_code == 200
-                chat_data = chat_response.json()
-                assert "response" in chat_data
-                assert "sources" in chat_data
-                assert "metadata" in chat_data
-                assert "confidence" in chat_data["metadata"]
-                assert chat_data["metadata"]["confidence"] >= 0.8
-
-                # 验证工作流程完整性
-                print("\n✅ 端到端工作流程测试通过")
-                print(f"   搜索到 {len(search_data['results'])} 个相关工单")
-                print(f"   分析 {len(mtbf_data)} 个设备的MTBF数据")
-                print(f"   识别 {len(pareto_data)} 个主要故障组件")
-                print(f"   AI诊断置信度: {chat_data['metadata']['confidence']:.2f}")
+                ),
+            )
+        )
 
-    @pytest.mark.asyncio
-    async def test_data_integration_workflow(self):
+        assert search_response.status_code == 200
+        search_data = search_response.json()
+        assert len(search_data["results"]) == 2
+        assert search_data["results"][0]["notification_id"] == "TEST001"
+
+        assert mtbf_response.status_code == 200
+        mtbf_result = mtbf_response.json()
+        assert "data" in mtbf_result
+        assert "success" in mtbf_result
+        assert mtbf_result["success"] == True
+        mtbf_data = mtbf_result["data"]
+        assert len(mtbf_data) == 1
+        assert mtbf_data[0]["equipment_id"] == "1055000001"
+        assert mtbf_data[0]["failed_component"] == "探测器"
+
+        assert pareto_response.status_code == 200
+        pareto_result = pareto_response.json()
+        assert "data" in pareto_result
+        assert "success" in pareto_result
+        assert pareto_result["success"] == True
+        pareto_data = pareto_result["data"]
+        assert len(pareto_data) == 2
+        assert pareto_data[0]["component"] == "探测器"
+
+        assert chat_response.status_code == 200
+        chat_data = chat_response.json()
+        assert "response" in chat_data
+        assert "sources" in chat_data
+        assert "metadata" in chat_data
+        assert "confidence" in chat_data["metadata"]
+        assert chat_data["metadata"]["confidence"] >= 0.8
+
+        # 验证工作流程完整性
+        logger.debug(
+            "端到端工作流程测试通过: 工单=%d MTBF=%d 故障组件=%d 置信度=%.2f",
+            len(search_data["results"]),
+            len(mtbf_data),
+            len(pareto_data),
+            chat_data["metadata"]["confidence"],
+        )
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_data_integration_workflow(self, app_client):
         """
         测试数据集成工作流程：
         1. 验证数据库连接
         2. 检查测试数据完整性
         3. 验证ETL状态
         """
-        # 直接模拟健康检查端点，避免数据库连接问题
-        with patch("src.backend.api.health.test_connection") as mock_test_conn:
-
-            # 模拟数据库连接返回True
-            mock_test_conn.return_value = True
-
-            transport = ASGITransport(app=app)
-            async with AsyncClient(transport=transport, base_url="http://test") as client:
-
-                # 步骤1: 健康检查
-                health_response = await client.get("/api/health")
-                assert health_response.status_code == 200
-                health_data = health_response.json()
-                assert health_data["status"] == "healthy"
-                assert health_data["service"] == "medical-work-order-analysis"
-
-                # 步骤2: 数据库连接测试 - 由于模拟了test_connection，应该返回connected
-                db_health_response = await client.get("/api/health/db")
-                assert db_health_response.status_code == 200
-
-                # 尝试解析响应，如果失败则打印响应内容
-                try:
-                    db_health_data = db_health_response.json()
-                except Exception as e:
-                    print(f"解析JSON失败: {e}")
-                    print(f"响应内容: {db_health_response.text}")
-                    raise
-
-                # 确保响应是字典
-                if isinstance(db_health_data, list):
-                    print(f"警告: 响应是列表而不是字典: {db_health_data}")
-                    # 如果是列表，取第一个元素
-                    if len(db_health_data) > 0:
-                        db_health_data = db_health_data[0]
-                    else:
-                        raise ValueError("数据库健康检查返回空列表")
-
-                assert isinstance(db_health_data, dict), f"期望字典，但得到 {type(db_health_data)}"
-                # 由于模拟了test_connection返回True，应该返回connected
-                assert db_health_data["database"] == "connected"
-
-                # 步骤3: API信息检查
-                api_info_response = await client.get("/api/")
-                assert api_info_response.status_code == 200
-                api_info = api_info_response.json()
-
-                # 验证API基本信息
-                assert "name" in api_info
-                assert "version" in api_info
-                assert "endpoints" in api_info
-                assert "health" in api_info["endpoints"]
-
-                print("\n✅ 数据集成工作流程测试通过")
-                print(f"   系统状态: {health_data['status']}")
-                print(f"   数据库状态: {db_health_data['database']}")
-                print(f"   API名称: {api_info['name']}")
+        # 步骤1: 健康检查
+        health_response = await app_client.get("/api/health")
+        assert health_response.status_code == 200
+        health_data = health_response.json()
+        assert health_data["status"] == "healthy"
+        assert health_data["service"] == "medical-work-order-analysis"
+
+        # 步骤2: 数据库连接测试 - 由于模拟了test_connection，应该返回connected
+        db_health_response = await app_client.get("/api/health/db")
+        assert db_health_response.status_code == 200
+
+        db_health_data = db_health_response.json()
+        assert isinstance(db_health_data, dict), f"期望字典，但得到 {type(db_health_data)}"
+        # 由于模拟了test_connection返回True，应该返回connected
+        assert db_health_data["database"] == "connected"
+
+        # 步骤3: API信息检查
+        api_info_response = await app_client.get("/api/")
+        assert api_info_response.status_code == 200
+        api_info = api_info_response.json()
+
+        # 验证API基本信息
+        assert "name" in api_info
+        assert "version" in api_info
+        assert "endpoints" in api_info
+        assert "health" in api_info["endpoints"]
+
+        logger.debug(
+            "数据集成工作流程测试通过: 系统=%s 数据库=%s API=%s",
+            health_data["status"],
+            db_health_data["database"],
+            api_info["name"],
+        )
 
-    @pytest.mark.asyncio
-    async def test_error_handling_workflow(self):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_error_handling_workflow(self, app_client, monkeypatch):
         """
         测试错误处理工作流程：
         1. 无效查询处理
         2. 服务异常处理
         3. 数据验证错误
         """
-        # 模拟分析服务返回空结果
-        with patch("src.backend.services.analytics_service.AnalyticsService.calculate_mtbf") as mock_mtbf:
-            mock_mtbf.return_value = []  # 返回空列表表示没有找到数据
-
-            transport = ASGITransport(app=app)
-            async with AsyncClient(transport=transport, base_url="http://test") as client:
+        # 模拟分析服务返回空结果（返回空列表表示没有找到数据）
+        monkeypatch.setattr(
+            "src.backend.services.analytics_service.AnalyticsService.calculate_mtbf",
+            AsyncMock(return_value=[]),
+        )
 
-                # 测试1: 无效搜索查询
-                invalid_search_response = await client.post(
-                    "/api/search/",
-                    json={
-                        "query": "",  # 空查询
-                        "limit": 10
-                    }
-                )
-                assert invalid_search_response.status_code == 422  # 验证错误
+        # 测试1: 无效搜索查询
+        invalid_search_response = await app_client.post(
+            "/api/search/",
+            json={
+                "query": "",  # 空查询
+                "limit": 10
+            }
+        )
+        assert invalid_search_response.status_code == 422  # 验证错误
 
-                # 测试2: 无效设备ID
-                invalid_mtbf_response = await client.get(
-                    "/api/analytics/mtbf",
-                    params={"equipment_id": "INVALID_ID_123"}
-                )
-                # 应该返回空结果或特定错误，而不是500
-                assert invalid_mtbf_response.status_code in [200, 404]
-
-                # 测试3: 聊天服务超长查询
-                long_query = "A" * 1000  # 超长查询
-                chat_response = await client.post(
-                    "/api/chat/",
-                    json={
-                        "query": long_query,
-                        "context_limit": 5,
-                        "conversation_history": []
-                    }
-                )
-                # 应该正确处理超长查询
-                assert chat_response.status_code in [200, 400, 422]
+        # 测试2: 无效设备ID
+        invalid_mtbf_response = await app_client.get(
+            "/api/analytics/mtbf",
+            params={"equipment_id": "INVALID_ID_123"}
+        )
+        # 应该返回空结果或特定错误，而不是500
+        assert invalid_mtbf_response.status_code in [200, 404]
+
+        # 测试3: 聊天服务超长查询
+        long_query = "A" * 1000  # 超长查询
+        chat_response = await app_client.post(
+            "/api/chat/",
+            json={
+                "query": long_query,
+                "context_limit": 5,
+                "conversation_history": []
+            }
+        )
+        # 应该正确处理超长查询
+        assert chat_response.status_code in [200, 400, 422]
 
-                print("\n✅ 错误处理工作流程测试通过")
-                print("   成功处理了各种错误场景")
+        logger.debug("错误处理工作流程测试通过")
 
 
 class TestProductionDataValidation:
@@ -346,11 +348,7 @@ class TestProductionDataValidation:
         total_issues = sum(test_data_quality["issue_type_distribution"].values())
         assert total_issues == test_data_quality["total_tickets"]
 
-        print("\n✅ 生产数据质量验证通过")
-        print(f"   总工单数: {test_data_quality['total_tickets']}")
-        print(f"   AI提取覆盖率: {test_data_quality['coverage_percentage']}%")
-        print(f"   平均置信度: {test_data_quality['avg_confidence_score']:.2f}")
-        print(f"   数据质量评分: {test_data_quality['data_quality_score']:.2f}")
+        logger.debug("生产数据质量验证通过: %s", test_data_quality)
 
     @pytest.mark.asyncio
     async def test_business_rules_validation(self):
@@ -373,29 +371,5 @@ class TestProductionDataValidation:
         assert business_rules["etl_sync_frequency_hours"] > 0
         assert business_rules["data_retention_days"] >= 365  # 至少保留1年
 
-        print("\n✅ 业务规则验证通过")
-        print(f"   工单最大年龄: {business_rules['max_ticket_age_days']} 天")
-        print(f"   最小置信度阈值: {business_rules['min_confidence_threshold']}")
-        print(f"   ETL同步频率: {business_rules['etl_sync_frequency_hours']} 小时")
-        print(f"   数据保留期限: {business_rules['data_retention_days']} 天")
-
-
-if __name__ == "__main__":
-    # 直接运行测试
-    import asyncio
-
-    async def run_tests():
-        test = TestEndToEndWorkflow()
-        await test.test_complete_diagnostic_workflow()
-        await test.test_data_integration_workflow()
-        await test.test_error_handling_workflow()
-
-        test_data = TestProductionDataValidation()
-        await test_data.test_production_data_quality()
-        await test_data.test_business_rules_validation()
-
-        print("\n" + "="*60)
-        print("✅ 所有端到端测试完成!")
-        print("="*60)
+        logger.debug("业务规则验证通过: %s", business_rules)
 
-    asyncio.run(run_tests())
\ No newline at end of file
@@ -1,4 +1,5 @@
-import json
+import logging
+import zlib
 import numpy as np
 from typing import List
 from unittest.mock import Mock, patch
@@ -8,17 +9,7 @@ import pytest
 from src.ai.embedding_pipeline import EmbeddingPipeline, EmbeddingCache
 from src.ai.openai_client import AzureOpenAIClient
 
-
-def cosine_similarity(a: List[float], b: List[float]) -> float:
-    """Compute cosine similarity between two vectors."""
-    a_np = np.array(a)
-    b_np = np.array(b)
-    dot = np.dot(a_np, b_np)
-    norm_a = np.linalg.norm(a_np)
-    norm_b = np.linalg.norm(b_np)
-    if norm_a == 0 or norm_b == 0:
-        return 0.0
-    return dot / (norm_a * norm_b)
+logger = logging.getLogger(__name__)
 
 
 def test_similarity_retrieval_regression():
@@ -27,17 +18,21 @@ def test_similarity_retrieval_regression():
 
     # Mock SDK to return deterministic vectors
     def mock_embeddings(texts: List[str], deployment: str = None):
-        # Generate deterministic pseudo-random vectors based on text length
-        vectors = []
-        for t in texts:
-            seed = sum(ord(c) for c in t) % 1000
-            np.random.seed(seed)
-            vec = np.random.randn(1536).tolist()
-            # Normalize to unit length
-            norm = np.linalg.norm(vec)
-            vec = (np.array(vec) / norm).tolist()
-            vectors.append(vec)
-        return vectors
+        # Generate deterministic pseudo-random vectors seeded from the text,
+        # using local generators so NumPy's global RNG state is left untouched
+        # crc32 runs in C and, unlike hash(), is stable across processes
+        seeds = np.fromiter(
+            (zlib.crc32(t.encode("utf-8")) & 0x3FF for t in texts),
+            dtype=np.int64,
+            count=len(texts),
+        )
+        vecs = np.stack(
+            [np.random.default_rng(int(seed)).standard_normal(1536) for seed in seeds]
+        )
+        # Normalize to unit length; EmbeddingPipeline only iterates rows and
+        # checks len(), so the ndarray is returned without a tolist() round-trip
+        vecs /= np.linalg.norm(vecs, axis=1, keepdims=True)
+        return vecs
 
     with patch.object(client, "create_embeddings", side_effect=mock_embeddings):
         pipeline = EmbeddingPipeline(client, embed_deployment="embed")
@@ -61,47 +56,42 @@ def test_similarity_retrieval_regression():
         query_vecs = pipeline.batch_generate(queries)
         corpus_vecs = pipeline.batch_generate(corpus)
 
-        # Compute similarity matrix
-        sim_matrix = []
-        for qv in query_vecs:
-            row = []
-            for cv in corpus_vecs:
-                row.append(cosine_similarity(qv, cv))
-            sim_matrix.append(row)
+        # Compute similarity matrix; mock vectors are unit-normalized, so cosine
+        # similarity reduces to a single dot-product matmul
+        # float32 is ample for ranking and halves memory traffic
+        Q = np.asarray(query_vecs, dtype=np.float32)
+        C = np.asarray(corpus_vecs, dtype=np.float32)
+        scores = Q @ C.T
+        sim_matrix = scores.tolist()
+        predicted = scores.argmax(axis=1)
 
         # Expect each query to be most similar to its corresponding corpus entry
-        expected_best = [0, 1, 2]  # indices in corpus
-        for i, (q, best_idx) in enumerate(zip(queries, expected_best)):
-            scores = sim_matrix[i]
-            predicted = np.argmax(scores)
-            # Allow small tolerance due to random vectors; in real deployment, embeddings should be semantically meaningful
-            if predicted != best_idx:
-                print(
-                    f"Query '{q}' best match index {predicted} (expected {best_idx}) scores: {scores}"
-                )
+        expected_best = np.asarray([0, 1, 2])  # indices in corpus
+        hits = predicted == expected_best
+        # Allow small tolerance due to random vectors; in real deployment, embeddings should be semantically meaningful
+        for i in np.flatnonzero(~hits):
+            logger.debug(
+                "Query '%s' best match index %d (expected %d) scores: %s",
+                queries[i],
+                predicted[i],
+                expected_best[i],
+                sim_matrix[i],
+            )
 
         # Store regression metrics for QA evidence
         metrics = {
             "queries": queries,
             "corpus": corpus,
             "similarity_matrix": sim_matrix,
-            "top1_accuracy": sum(
-                1 for i, b in enumerate(expected_best) if np.argmax(sim_matrix[i]) == b
-            )
-            / len(queries),
+            "top1_accuracy": float(hits.mean()),
         }
-        print(
-            "Similarity regression metrics:", json.dumps(metrics, indent=2, default=str)
-        )
+        logger.debug("Similarity regression metrics: %s", metrics)
 
         # For now, just ensure embeddings are generated and similarity is computed
         assert len(query_vecs) == len(queries)
         assert len(corpus_vecs) == len(corpus)
         assert all(len(v) == 1536 for v in query_vecs + corpus_vecs)
-        print("Similarity retrieval regression test passed.")
 
 
 if __name__ == "__main__":
-    import json
-
     test_similarity_retrieval_regression()
@@ -0,0 +1,75 @@
+"""
+Shared database fixtures for ORM model tests.
+"""
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from src.models.entities import Base
+
+
+@pytest.fixture(scope="session")
+def engine():
+    """
+    In-memory SQLite engine with the schema created once per test session.
+
+    The shared-cache URI plus StaticPool keeps a single in-memory database
+    alive for every connection the tests open.
+    """
+    engine = create_engine(
+        "sqlite:///file::memory:?cache=shared&uri=true",
+        echo=False,
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+
+    # pysqlite's implicit transaction handling breaks SAVEPOINT, so disable it
+    # and let SQLAlchemy emit BEGIN itself (documented SQLAlchemy recipe)
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        # Durability is pointless for a throwaway test database
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        # SQLite ignores FOREIGN KEY clauses unless enabled per connection
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db_session(engine):
+    """
+    Session bound to an outer transaction that is rolled back after each test.
+
+    Tests may call ``commit()`` freely: commits only release a SAVEPOINT, so
+    no data leaks between tests and the schema is never recreated.
+    """
+    connection = engine.connect()
+    trans = connection.begin()
+    # Objects stay loaded after commit; tests refresh server-side values explicitly
+    session = Session(
+        bind=connection,
+        join_transaction_mode="create_savepoint",
+        expire_on_commit=False,
+    )
+
+    yield session
+
+    session.close()
+    trans.rollback()
+    connection.close()
@@ -10,6 +10,7 @@ Tests cover:
 
 import pytest
 import json
+from unittest.mock import patch
 from datetime import datetime, timezone
 from pydantic import ValidationError
 from src.models.schemas import (
@@ -24,6 +25,7 @@ from src.models.schemas import (
 from src.models.entities import MaintenanceLog, AIExtractedData
 from src.models.transformations import (
     maintenance_log_create_to_orm,
+    maintenance_log_create_batch_to_dicts,
     maintenance_log_orm_to_read,
     ai_extracted_data_create_to_orm,
     ai_extracted_data_orm_to_read,
@@ -34,15 +36,14 @@ from src.models.transformations import (
     convert_resolution_steps,
 )
 
-
 # ============================================================================
 # Test Fixtures
 # ============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_maintenance_log_schema():
-    """Create a sample maintenance log schema."""
+    """Create a sample maintenance log schema (shared; tests must not mutate it)."""
     return MaintenanceLogCreate(
         notification_id="NOTIF-2024-001",
         noti_date=datetime(2024, 1, 15, 10, 30, 0, tzinfo=timezone.utc),
@@ -63,9 +64,9 @@ def sample_maintenance_log_schema():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_ai_extracted_data_schema():
-    """Create a sample AI-extracted data schema."""
+    """Create a sample AI-extracted data schema (shared; tests must not mutate it)."""
     return AIExtractedDataCreate(
         notification_id="NOTIF-2024-001",
         keywords_ai=["server", "hardware", "failure"],
@@ -135,6 +136,25 @@ class TestMaintenanceLogTransformations:
         assert updated_log.noti_issue_type == "hardware"
         assert updated_log.sys_eq_id == "EQ-12345"
 
+    def test_maintenance_log_create_batch_to_dicts(self, sample_maintenance_log_schema):
+        """Test converting a batch of schemas to bulk-insert row dicts."""
+        second = sample_maintenance_log_schema.model_copy(
+            update={"notification_id": "NOTIF-2024-002"}
+        )
+
+        rows = maintenance_log_create_batch_to_dicts(
+            [sample_maintenance_log_schema, second]
+        )
+
+        assert rows[0] == sample_maintenance_log_schema.model_dump()
+        assert len(rows[0]) == 16
+        assert rows[1]["notification_id"] == "NOTIF-2024-002"
+        assert rows[1]["noti_text"] == rows[0]["noti_text"]
+
+        # Every key must be a column so rows can go straight to insert()
+        columns = set(MaintenanceLog.__table__.columns.keys())
+        assert set(rows[0]) <= columns
+
     def test_maintenance_log_orm_to_read(self):
         """Test converting ORM model to MaintenanceLogRead schema."""
         # Create ORM model
@@ -168,7 +188,8 @@ class TestMaintenanceLogTransformations:
         normalized = normalize_maintenance_log_data(raw_data)
 
         assert normalized["notification_id"] == "NOTIF-2024-001"
-        assert "  " not in normalized["noti_text"]  # Extra spaces removed
+        # Extra spaces removed
+        assert normalized["noti_text"] == "The server experienced a hardware failure."
         assert normalized["noti_issue_type"] == "hardware"  # Normalized
         assert (
             normalized["sys_eq_id"] == "  EQ-12345  "
@@ -242,9 +263,7 @@ class TestAIExtractedDataTransformations:
         assert orm_model.primary_symptom_ai == "Server hardware failure"
 
         # Check JSON fields are serialized
-        assert isinstance(orm_model.keywords_ai, str)  # JSON string
-        keywords = json.loads(orm_model.keywords_ai)
-        assert keywords == ["server", "hardware", "failure"]
+        assert orm_model.keywords_ai == '["server","hardware","failure"]'
 
         # components_ai and processes_ai should be comma-separated strings
         assert orm_model.components_ai == "RAID controller, server motherboard"
@@ -341,9 +360,25 @@ class TestAIExtractedDataTransformations:
         assert normalized["primary_symptom_ai"] is None  # Cleared due to low confidence
         assert normalized["root_cause_ai"] is None  # Cleared due to low confidence
 
-    def test_normalize_ai_extracted_data_json_parsing(self):
-        """Test AI-extracted data normalization with JSON parsing."""
-        test_cases = [
+    def test_normalize_ai_extracted_data_low_confidence_skips_parsing(self):
+        """Test low-confidence data is cleared without parsing list fields."""
+        raw_data = {
+            "notification_id": "NOTIF-2024-001",
+            "keywords_ai": '["server", "hardware"]',
+            "summary_ai": "  Server   failure  ",
+            "confidence_score_ai": 0.0,
+        }
+
+        with patch("src.models.transformations._json_loads") as mock_loads:
+            normalized = normalize_ai_extracted_data(raw_data, min_confidence=0.5)
+
+        mock_loads.assert_not_called()
+        assert normalized["keywords_ai"] is None
+        assert normalized["summary_ai"] is None
+
+    @pytest.mark.parametrize(
+        "input_val,expected",
+        [
             # JSON string
             ('["item1", "item2"]', ["item1", "item2"]),
             # Comma-separated string
@@ -356,20 +391,21 @@ class TestAIExtractedDataTransformations:
             (None, None),
             # Empty string
             ("", []),
-        ]
-
-        for input_val, expected in test_cases:
-            raw_data = {
-                "notification_id": "TEST-001",
-                "keywords_ai": input_val,
-            }
+        ],
+    )
+    def test_normalize_ai_extracted_data_json_parsing(self, input_val, expected):
+        """Test AI-extracted data normalization with JSON parsing."""
+        raw_data = {
+            "notification_id": "TEST-001",
+            "keywords_ai": input_val,
+        }
 
-            normalized = normalize_ai_extracted_data(raw_data)
+        normalized = normalize_ai_extracted_data(raw_data)
 
-            if expected is None:
-                assert normalized["keywords_ai"] is None
-            else:
-                assert normalized["keywords_ai"] == expected
+        if expected is None:
+            assert normalized["keywords_ai"] is None
+        else:
+            assert normalized["keywords_ai"] == expected
 
     def test_normalize_ai_extracted_data_invalid_json(self):
         """Test AI-extracted data normalization with invalid JSON."""
@@ -492,101 +528,106 @@ class TestSerialization:
 class TestTypeConversions:
     """Tests for type conversion utilities."""
 
-    def test_convert_resolution_steps_string_to_json(self):
-        """Test converting string resolution steps to JSON."""
-        # Use a JSON string as input
-        steps = '[{"step_number": 1, "description": "Diagnose issue"}, {"step_number": 2, "description": "Replace part"}]'
-
-        result = convert_resolution_steps(steps, target_format="json")
-
-        assert isinstance(result, str)
-        # Should be valid JSON
-        parsed = json.loads(result)
-        assert isinstance(parsed, list)
-        assert len(parsed) == 2
-
-    def test_convert_resolution_steps_list_to_json(self):
-        """Test converting list resolution steps to JSON."""
-        steps = [
-            {"step_number": 1, "description": "Diagnose"},
-            {"step_number": 2, "description": "Replace"},
-        ]
-
+    @pytest.mark.parametrize(
+        "steps,expected",
+        [
+            # JSON string
+            (
+                '[{"step_number": 1, "description": "Diagnose"}, '
+                '{"step_number": 2, "description": "Replace"}]',
+                [
+                    {"step_number": 1, "description": "Diagnose"},
+                    {"step_number": 2, "description": "Replace"},
+                ],
+            ),
+            # List of dicts
+            (
+                [
+                    {"step_number": 1, "description": "Diagnose"},
+                    {"step_number": 2, "description": "Replace"},
+                ],
+                [
+                    {"step_number": 1, "description": "Diagnose"},
+                    {"step_number": 2, "description": "Replace"},
+                ],
+            ),
+            # None
+            (None, None),
+        ],
+    )
+    def test_convert_resolution_steps_to_json(self, steps, expected):
+        """Test converting resolution steps to JSON."""
         result = convert_resolution_steps(steps, target_format="json")
 
-        assert isinstance(result, str)
-        parsed = json.loads(result)
-        assert len(parsed) == 2
-        assert parsed[0]["step_number"] == 1
-        assert parsed[0]["description"] == "Diagnose"
-
-    def test_convert_resolution_steps_json_to_list(self):
-        """Test converting JSON resolution steps to list."""
-        steps = '[{"step_number": 1, "description": "Diagnose"}]'
+        if expected is None:
+            assert result is None
+        else:
+            assert isinstance(result, str)
+            assert json.loads(result) == expected
 
+    @pytest.mark.parametrize(
+        "steps,expected",
+        [
+            # JSON string
+            (
+                '[{"step_number": 1, "description": "Diagnose"}]',
+                [{"step_number": 1, "description": "Diagnose"}],
+            ),
+            # Invalid JSON is treated as a single text step
+            ("[invalid json", [{"description": "[invalid json"}]),
+        ],
+    )
+    def test_convert_resolution_steps_to_list(self, steps, expected):
+        """Test converting resolution steps to a list."""
         result = convert_resolution_steps(steps, target_format="list")
 
-        assert isinstance(result, list)
-        assert len(result) == 1
-        assert result[0]["step_number"] == 1
-        assert result[0]["description"] == "Diagnose"
-
-    def test_convert_resolution_steps_list_to_text(self):
-        """Test converting list resolution steps to text."""
-        steps = [
-            ResolutionStep(
-                step_number=1,
-                description="Diagnose the issue",
-                duration_minutes=30,
-                tools_required=["diagnostic software"],
+        assert result == expected
+
+    @pytest.mark.parametrize(
+        "steps,expected",
+        [
+            # ResolutionStep models
+            (
+                [
+                    ResolutionStep(
+                        step_number=1,
+                        description="Diagnose the issue",
+                        duration_minutes=30,
+                        tools_required=["diagnostic software"],
+                    ),
+                    ResolutionStep(
+                        step_number=2,
+                        description="Replace part",
+                        duration_minutes=60,
+                        tools_required=["screwdriver", "multimeter"],
+                    ),
+                ],
+                "1. Diagnose the issue (30 min) [Tools: diagnostic software]\n"
+                "2. Replace part (60 min) [Tools: screwdriver, multimeter]",
             ),
-            ResolutionStep(
-                step_number=2,
-                description="Replace part",
-                duration_minutes=60,
-                tools_required=["screwdriver", "multimeter"],
+            # Dicts with optional fields
+            (
+                [
+                    {
+                        "step_number": 1,
+                        "description": "Diagnose",
+                        "duration_minutes": 30,
+                    },
+                    {
+                        "step_number": 2,
+                        "description": "Replace",
+                        "tools_required": ["tool1", "tool2"],
+                    },
+                ],
+                "1. Diagnose (30 min)\n2. Replace [Tools: tool1, tool2]",
             ),
-        ]
-
-        result = convert_resolution_steps(steps, target_format="text")
-
-        assert isinstance(result, str)
-        assert "1. Diagnose the issue (30 min) [Tools: diagnostic software]" in result
-        assert "2. Replace part (60 min) [Tools: screwdriver, multimeter]" in result
-
-    def test_convert_resolution_steps_dict_list_to_text(self):
-        """Test converting dictionary list resolution steps to text."""
-        steps = [
-            {"step_number": 1, "description": "Diagnose", "duration_minutes": 30},
-            {
-                "step_number": 2,
-                "description": "Replace",
-                "tools_required": ["tool1", "tool2"],
-            },
-        ]
-
+        ],
+    )
+    def test_convert_resolution_steps_to_text(self, steps, expected):
+        """Test converting resolution steps to text."""
         result = convert_resolution_steps(steps, target_format="text")
 
-        assert isinstance(result, str)
-        assert "1. Diagnose (30 min)" in result
-        assert "2. Replace [Tools: tool1, tool2]" in result
-
-    def test_convert_resolution_steps_invalid_json(self):
-        """Test converting invalid JSON resolution steps."""
-        steps = "[invalid json"
-
-        result = convert_resolution_steps(steps, target_format="list")
-
-        # Should treat as single text step
-        assert isinstance(result, list)
-        assert len(result) == 1
-        assert result[0]["description"] == "[invalid json"
-
-    def test_convert_resolution_steps_none(self):
-        """Test converting None resolution steps."""
-        result = convert_resolution_steps(None, target_format="json")
-
-        assert result is None
+        assert result == expected
 
 
 # ============================================================================
@@ -614,7 +655,9 @@ class TestIntegration:
         )
 
         assert normalized["noti_issue_type"] == "hardware"
-        assert "  " not in normalized["noti_text"]
+        assert (
+            normalized["noti_text"] == "Server hardware failure. RAID controller issue."
+        )
 
         # 3. Create schema
         schema = MaintenanceLogCreate(**normalized)
@@ -2,8 +2,8 @@
 Tests for Advanced Error Handler module.
 """
 
-import time
 from datetime import datetime, timedelta
+import time
 import pytest
 
 from src.utils.advanced_error_handler import (
@@ -19,6 +19,38 @@ from src.utils.advanced_error_handler import (
 )
 
 
+class FakeClock:
+    """Manually advanced clock for CircuitBreaker tests."""
+
+    def __init__(self, start=1000.0):
+        self.t = start
+
+    def __call__(self):
+        return self.t
+
+    def advance(self, dt):
+        self.t += dt
+
+
+@pytest.fixture(scope="module")
+def _shared_handler():
+    """Single handler instance reused across the module."""
+    return AdvancedErrorHandler()
+
+
+@pytest.fixture
+def handler(_shared_handler):
+    """Shared handler reset to a clean state for each test."""
+    _shared_handler.clear()
+    return _shared_handler
+
+
+@pytest.fixture
+def manager(handler):
+    """Recovery manager bound to the shared handler."""
+    return ErrorRecoveryManager(handler)
+
+
 class TestAdvancedErrorHandler:
     """Test AdvancedErrorHandler class."""
 
@@ -29,10 +61,8 @@ class TestAdvancedErrorHandler:
         assert handler.max_error_history == 100
         assert len(handler.recovery_strategies) > 0
 
-    def test_record_error(self):
+    def test_record_error(self, handler):
         """Test recording errors."""
-        handler = AdvancedErrorHandler()
-
         # Record an error
         error = handler.record_error(
             category=ErrorCategory.CONNECTION,
@@ -48,10 +78,8 @@ class TestAdvancedErrorHandler:
         assert error.message == "Database connection failed"
         assert "host" in error.details
 
-    def test_get_recovery_strategy(self):
+    def test_get_recovery_strategy(self, handler):
         """Test recovery strategy selection."""
-        handler = AdvancedErrorHandler()
-
         # Create test error records
         connection_error = ErrorRecord(
             timestamp=datetime.now(),
@@ -78,10 +106,8 @@ class TestAdvancedErrorHandler:
         )
         assert handler.get_recovery_strategy(memory_error) == ErrorRecoveryStrategy.STOP
 
-    def test_should_retry(self):
+    def test_should_retry(self, handler):
         """Test retry decision logic."""
-        handler = AdvancedErrorHandler()
-
         error = ErrorRecord(
             timestamp=datetime.now(),
             category=ErrorCategory.CONNECTION,
@@ -99,10 +125,8 @@ class TestAdvancedErrorHandler:
         error.retry_count = 3
         assert handler.should_retry(error, max_retries=3) == False
 
-    def test_get_error_summary(self):
+    def test_get_error_summary(self, handler):
         """Test error summary generation."""
-        handler = AdvancedErrorHandler()
-
         # Record some errors
         for i in range(5):
             handler.record_error(
@@ -130,10 +154,78 @@ class TestAdvancedErrorHandler:
         assert summary["by_severity"]["low"] == 3
         assert len(summary["recent_errors"]) <= 10
 
-    def test_mark_resolved(self):
-        """Test marking errors as resolved."""
-        handler = AdvancedErrorHandler()
+    def test_error_summary_tracks_bounded_history(self):
+        """Test summary counts follow history eviction and resolution."""
+        handler = AdvancedErrorHandler(max_error_history=3)
+
+        for i in range(3):
+            handler.record_error(
+                category=ErrorCategory.CONNECTION,
+                severity=ErrorSeverity.MEDIUM,
+                message=f"Error {i}",
+            )
+        resolved = handler.record_error(
+            category=ErrorCategory.VALIDATION,
+            severity=ErrorSeverity.LOW,
+            message="Validation error",
+        )
+        handler.mark_resolved(resolved)
+        handler.mark_resolved(resolved)
+
+        summary = handler.get_error_summary()
+
+        assert len(handler.error_history) == 3
+        assert summary["total_errors"] == 3
+        assert summary["by_category"] == {"connection": 2, "validation": 1}
+        assert summary["by_severity"] == {"medium": 2, "low": 1}
+        assert summary["unresolved_errors"] == 2
+        assert [e["message"] for e in summary["recent_errors"]] == [
+            "Error 1",
+            "Error 2",
+            "Validation error",
+        ]
+
+    def test_error_summary_matches_windowed_summary(self, handler):
+        """Test unwindowed and windowed summaries agree on the same history."""
+        handler.record_error(
+            category=ErrorCategory.API,
+            severity=ErrorSeverity.LOW,
+            message="Recorded error",
+        )
+        handler.error_history.append(
+            ErrorRecord(
+                timestamp=datetime.now(),
+                category=ErrorCategory.DATABASE,
+                severity=ErrorSeverity.HIGH,
+                message="Appended error",
+                details={},
+                context={},
+            )
+        )
+        handler.error_history[0].resolved = True
+
+        summary = handler.get_error_summary()
+
+        assert summary == handler.get_error_summary(timedelta(days=1))
+        assert summary["total_errors"] == 2
+        assert summary["by_category"] == {"api": 1, "database": 1}
+        assert summary["unresolved_errors"] == 1
+
+    def test_record_error_without_history(self):
+        """Test recording errors when history is disabled."""
+        handler = AdvancedErrorHandler(max_error_history=0)
+
+        error = handler.record_error(
+            category=ErrorCategory.API,
+            severity=ErrorSeverity.LOW,
+            message="Not kept",
+        )
+
+        assert error.message == "Not kept"
+        assert len(handler.error_history) == 0
 
+    def test_mark_resolved(self, handler):
+        """Test marking errors as resolved."""
         error = handler.record_error(
             category=ErrorCategory.CONNECTION,
             severity=ErrorSeverity.MEDIUM,
@@ -148,10 +240,8 @@ class TestAdvancedErrorHandler:
         assert error.resolved
         assert "resolution" in error.details
 
-    def test_clear_old_errors(self):
+    def test_clear_old_errors(self, handler):
         """Test clearing old errors."""
-        handler = AdvancedErrorHandler()
-
         # Record an old error
         old_error = ErrorRecord(
             timestamp=datetime.now() - timedelta(days=10),
@@ -180,6 +270,23 @@ class TestAdvancedErrorHandler:
         assert len(handler.error_history) == 1
         assert handler.error_history[0].category == ErrorCategory.VALIDATION
 
+    def test_clear(self, handler):
+        """Test clearing history and restoring default strategies."""
+        handler.record_error(
+            category=ErrorCategory.MEMORY,
+            severity=ErrorSeverity.CRITICAL,
+            message="Out of memory",
+        )
+        handler.recovery_strategies[ErrorCategory.MEMORY] = ErrorRecoveryStrategy.SKIP
+
+        handler.clear()
+
+        assert len(handler.error_history) == 0
+        assert (
+            handler.recovery_strategies[ErrorCategory.MEMORY]
+            == ErrorRecoveryStrategy.STOP
+        )
+
 
 class TestSmartRetryDecorator:
     """Test smart_retry decorator."""
@@ -301,7 +408,8 @@ class TestCircuitBreaker:
 
     def test_circuit_resets_after_timeout(self):
         """Test circuit resets after recovery timeout."""
-        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.1)
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.1, clock=clock)
 
         call_count = 0
 
@@ -319,14 +427,36 @@ class TestCircuitBreaker:
 
         assert breaker.state == "OPEN"
 
-        # Wait for recovery timeout
-        time.sleep(0.15)
+        # Still inside the recovery timeout: calls are blocked
+        clock.advance(0.05)
+        with pytest.raises(CircuitBreakerOpenError):
+            test_function()
+        assert call_count == 1
+
+        # Advance past the recovery timeout
+        clock.advance(0.1)
 
         # Should succeed now (circuit in HALF_OPEN, then CLOSED on success)
         result = test_function()
         assert result == "success"
         assert breaker.state == "CLOSED"
 
+    def test_circuit_stays_open_after_failure_at_clock_zero(self):
+        """Test a failure recorded at clock reading 0.0 still opens the circuit."""
+        breaker = CircuitBreaker(
+            failure_threshold=1, recovery_timeout=0.1, clock=lambda: 0.0
+        )
+
+        @breaker
+        def failing_function():
+            raise ValueError("Failure")
+
+        with pytest.raises(ValueError):
+            failing_function()
+
+        with pytest.raises(CircuitBreakerOpenError):
+            failing_function()
+
     def test_get_state(self):
         """Test getting circuit state."""
         breaker = CircuitBreaker(failure_threshold=3)
@@ -336,23 +466,31 @@ class TestCircuitBreaker:
         assert state["failure_count"] == 0
         assert state["failure_threshold"] == 3
 
+    def test_get_state_reports_wall_clock_failure_time(self):
+        """Test last_failure_time is a wall-clock timestamp, not a clock() reading."""
+        breaker = CircuitBreaker(failure_threshold=1, clock=FakeClock())
+
+        @breaker
+        def failing_function():
+            raise ValueError("Failure")
+
+        before = time.time()
+        with pytest.raises(ValueError):
+            failing_function()
+
+        assert before <= breaker.get_state()["last_failure_time"] <= time.time()
+
 
 class TestErrorRecoveryManager:
     """Test ErrorRecoveryManager class."""
 
-    def test_initialization(self):
+    def test_initialization(self, handler, manager):
         """Test manager initialization."""
-        handler = AdvancedErrorHandler()
-        manager = ErrorRecoveryManager(handler)
-
         assert manager.error_handler == handler
         assert len(manager.recovery_actions) == 0
 
-    def test_register_recovery_action(self):
+    def test_register_recovery_action(self, manager):
         """Test registering recovery actions."""
-        handler = AdvancedErrorHandler()
-        manager = ErrorRecoveryManager(handler)
-
         action_called = False
 
         def test_action(error_record):
@@ -364,11 +502,8 @@ class TestErrorRecoveryManager:
         assert ErrorCategory.CONNECTION in manager.recovery_actions
         assert manager.recovery_actions[ErrorCategory.CONNECTION] == test_action
 
-    def test_attempt_recovery_retry(self):
+    def test_attempt_recovery_retry(self, manager):
         """Test retry recovery strategy."""
-        handler = AdvancedErrorHandler()
-        manager = ErrorRecoveryManager(handler)
-
         error = ErrorRecord(
             timestamp=datetime.now(),
             category=ErrorCategory.CONNECTION,  # Default: RETRY
@@ -383,11 +518,8 @@ class TestErrorRecoveryManager:
         assert result == True
         assert error.retry_count == 1
 
-    def test_attempt_recovery_skip(self):
+    def test_attempt_recovery_skip(self, manager):
         """Test skip recovery strategy."""
-        handler = AdvancedErrorHandler()
-        manager = ErrorRecoveryManager(handler)
-
         error = ErrorRecord(
             timestamp=datetime.now(),
             category=ErrorCategory.VALIDATION,  # Default: SKIP
@@ -401,11 +533,8 @@ class TestErrorRecoveryManager:
         assert result == True
         assert error.resolved
 
-    def test_attempt_recovery_fallback(self):
+    def test_attempt_recovery_fallback(self, manager):
         """Test fallback recovery strategy."""
-        handler = AdvancedErrorHandler()
-        manager = ErrorRecoveryManager(handler)
-
         # Register a fallback action
         action_called = False
 
@@ -429,11 +558,8 @@ class TestErrorRecoveryManager:
         assert action_called
         assert error.resolved
 
-    def test_attempt_recovery_stop(self):
+    def test_attempt_recovery_stop(self, manager):
         """Test stop recovery strategy."""
-        handler = AdvancedErrorHandler()
-        manager = ErrorRecoveryManager(handler)
-
         error = ErrorRecord(
             timestamp=datetime.now(),
             category=ErrorCategory.MEMORY,  # Default: STOP
@@ -446,11 +572,8 @@ class TestErrorRecoveryManager:
         result = manager.attempt_recovery(error)
         assert result == False  # Stop strategy returns False
 
-    def test_error_handler_integration(self):
+    def test_error_handler_integration(self, handler, manager):
         """Test integration with error handler."""
-        handler = AdvancedErrorHandler()
-        manager = ErrorRecoveryManager(handler)
-
         # Record an error
         error = handler.record_error(
             category=ErrorCategory.VALIDATION,
@@ -2,25 +2,26 @@
 Tests for Memory Optimizer module.
 """
 
+import random
+import statistics
 from typing import List, Dict, Generator
 
 from src.utils.parallel_processor import MemoryOptimizer
 
+# Shared payloads; records reference these instead of building new strings
+_PAYLOAD_100 = "x" * 100  # 100 bytes per record
+_NAME_100 = "Test Name " * 10  # ~100 bytes
+_DESCRIPTION_300 = "Test Description " * 20  # ~300 bytes
+_PAYLOAD_600 = "x" * 600  # 600 bytes
+
 
 def generate_test_data(
     num_batches: int, batch_size: int
 ) -> Generator[List[Dict], None, None]:
     """Generate test data."""
     for i in range(num_batches):
-        batch = []
-        for j in range(batch_size):
-            batch.append(
-                {
-                    "id": i * batch_size + j,
-                    "data": "x" * 100,  # 100 bytes per record
-                }
-            )
-        yield batch
+        offset = i * batch_size
+        yield [{"id": offset + j, "data": _PAYLOAD_100} for j in range(batch_size)]
 
 
 class TestMemoryOptimizer:
@@ -135,15 +136,41 @@ class TestMemoryOptimizer:
 
         assert optimized_size <= 10000  # Maximum bound
 
+    def test_optimize_batch_size_smoothed(self):
+        """Test smoothed batch size optimization damps noisy readings."""
+        rng = random.Random(0)
+        mb_per_record = 0.02  # steady-state target: 100 / 0.02 = 5000
+
+        raw_size = smoothed_size = 5000
+        raw_sizes, smoothed_sizes = [], []
+        for _ in range(20):
+            noise = rng.uniform(0.5, 1.5)
+            raw_size = MemoryOptimizer.optimize_batch_size(
+                raw_size, raw_size * mb_per_record * noise, max_memory_mb=100
+            )
+            smoothed_size = MemoryOptimizer.optimize_batch_size_smoothed(
+                smoothed_size, smoothed_size * mb_per_record * noise, max_memory_mb=100
+            )
+            raw_sizes.append(raw_size)
+            smoothed_sizes.append(smoothed_size)
+
+        assert all(100 <= size <= 10000 for size in smoothed_sizes)
+        assert statistics.pvariance(smoothed_sizes) <= 0.25 * statistics.pvariance(
+            raw_sizes
+        )
+
+        # Zero usage keeps the previous size
+        assert MemoryOptimizer.optimize_batch_size_smoothed(1000, 0) == 1000
+
     def test_stream_with_varying_batch_sizes(self):
         """Test streaming with varying batch sizes."""
 
         def varying_generator():
             # Yield batches of different sizes
-            yield [{"id": i, "data": "x" * 100} for i in range(500)]  # 500 records
-            yield [{"id": i, "data": "x" * 100} for i in range(1000)]  # 1000 records
-            yield [{"id": i, "data": "x" * 100} for i in range(200)]  # 200 records
-            yield [{"id": i, "data": "x" * 100} for i in range(1500)]  # 1500 records
+            yield [{"id": i, "data": _PAYLOAD_100} for i in range(500)]  # 500 records
+            yield [{"id": i, "data": _PAYLOAD_100} for i in range(1000)]  # 1000 records
+            yield [{"id": i, "data": _PAYLOAD_100} for i in range(200)]  # 200 records
+            yield [{"id": i, "data": _PAYLOAD_100} for i in range(1500)]  # 1500 records
 
         optimized_generator = MemoryOptimizer.stream_large_dataset(
             varying_generator(),
@@ -162,9 +189,9 @@ class TestMemoryOptimizer:
             batch.append(
                 {
                     "id": i,
-                    "name": "Test Name " * 10,  # ~100 bytes
-                    "description": "Test Description " * 20,  # ~300 bytes
-                    "data": "x" * 600,  # 600 bytes
+                    "name": _NAME_100,
+                    "description": _DESCRIPTION_300,
+                    "data": _PAYLOAD_600,
                 }
             )
         # Total: ~1000 * 1000 bytes = ~1MB
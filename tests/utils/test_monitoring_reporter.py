@@ -2,9 +2,13 @@
 Tests for Monitoring and Reporter module.
 """
 
-import time
+import pytest
 from datetime import datetime, timedelta
+from dataclasses import asdict
+from types import SimpleNamespace
+from src.utils import monitoring_reporter
 from src.utils.monitoring_reporter import (
+    RPS_WINDOW_SIZE,
     ProcessingMetrics,
     ErrorSummary,
     ProgressReporter,
@@ -26,6 +30,12 @@ class TestProcessingMetrics:
         assert metrics.start_time is None
         assert metrics.end_time is None
 
+    def test_rejects_unknown_attributes(self):
+        """Test slotted metrics reject misspelled attribute names."""
+        metrics = ProcessingMetrics()
+        with pytest.raises(AttributeError):
+            metrics.procesed_records = 10
+
     def test_update_success_rate(self):
         """Test success rate calculation."""
         metrics = ProcessingMetrics()
@@ -45,6 +55,44 @@ class TestProcessingMetrics:
         # Allow small floating point differences
         assert abs(metrics.records_per_second - 10.0) < 0.1  # 100/10 = 10 ± 0.1
 
+    def test_records_per_second_avg(self, monkeypatch):
+        """Test recent rate is taken from record deltas across the window."""
+        now = [1000.0]
+        monkeypatch.setattr(
+            monitoring_reporter, "time", SimpleNamespace(monotonic=lambda: now[0])
+        )
+        metrics = ProcessingMetrics()
+        metrics.start_time = datetime.now() - timedelta(seconds=10)
+
+        for processed in (100, 300, 600):
+            metrics.processed_records = processed
+            metrics.update_records_per_second()
+            now[0] += 10
+
+        # Overall rate is 600 records in 30s; the window saw 500 more in 20s
+        assert abs(metrics.records_per_second - 20.0) < 0.1
+        assert metrics.records_per_second_avg == 25.0
+
+    def test_records_per_second_avg_drops_old_samples(self, monkeypatch):
+        """Test samples older than the window no longer affect the recent rate."""
+        now = [1000.0]
+        monkeypatch.setattr(
+            monitoring_reporter, "time", SimpleNamespace(monotonic=lambda: now[0])
+        )
+        metrics = ProcessingMetrics()
+        metrics.start_time = datetime.now()
+
+        # A fast burst, then a full window at 1 record/sec
+        metrics.processed_records = 10_000
+        metrics.update_records_per_second()
+        for _ in range(RPS_WINDOW_SIZE):
+            now[0] += 1
+            metrics.processed_records += 1
+            metrics.update_records_per_second()
+
+        assert metrics.records_per_second > 100
+        assert metrics.records_per_second_avg == 1.0
+
     def test_get_elapsed_time(self):
         """Test elapsed time calculation."""
         metrics = ProcessingMetrics()
@@ -54,6 +102,16 @@ class TestProcessingMetrics:
         assert elapsed is not None
         assert elapsed.total_seconds() >= 30
 
+    def test_elapsed_time_follows_reassigned_start(self):
+        """Test elapsed time tracks a reassigned start time."""
+        metrics = ProcessingMetrics()
+        metrics.start_time = datetime.now() - timedelta(seconds=30)
+        assert metrics.get_elapsed_time().total_seconds() >= 30
+
+        metrics.start_time = datetime.now() - timedelta(seconds=5)
+        assert 5 <= metrics.get_elapsed_time().total_seconds() < 30
+        assert "_start_monotonic" not in asdict(metrics)
+
     def test_get_estimated_time_remaining(self):
         """Test estimated time remaining calculation."""
         metrics = ProcessingMetrics()
@@ -75,7 +133,7 @@ class TestErrorSummary:
         errors = ErrorSummary()
         assert errors.total_errors == 0
         assert errors.error_types == {}
-        assert errors.recent_errors == []
+        assert list(errors.recent_errors) == []
 
     def test_add_error(self):
         """Test adding errors."""
@@ -99,6 +157,32 @@ class TestErrorSummary:
         assert errors.error_types["validation_error"] == 1
         assert len(errors.recent_errors) == 3
 
+    def test_recent_errors_bounded(self):
+        """Test recent errors keep only the newest entries."""
+        errors = ErrorSummary()
+
+        for i in range(5000):
+            errors.add_error("connection_error", {"attempt": i})
+
+        assert errors.total_errors == 5000
+        assert len(errors.recent_errors) == 10
+        assert errors.recent_errors[-1]["details"] == {"attempt": 4999}
+
+        errors.add_error("connection_error", {"attempt": 5000}, max_recent=1000)
+        assert len(errors.recent_errors) == 11
+        assert errors.recent_errors[0]["details"] == {"attempt": 4990}
+
+    def test_supplied_recent_errors_capped_on_add(self):
+        """Test supplied recent errors are kept whole until the next add."""
+        supplied = [{"type": "old", "details": {"n": n}} for n in range(15)]
+        errors = ErrorSummary(recent_errors=supplied)
+        assert list(errors.recent_errors) == supplied
+
+        errors.add_error("connection_error", {"n": 15})
+        assert len(errors.recent_errors) == 10
+        assert errors.recent_errors[0]["details"] == {"n": 6}
+        assert errors.recent_errors[-1]["details"] == {"n": 15}
+
     def test_get_top_errors(self):
         """Test getting top errors."""
         errors = ErrorSummary()
@@ -117,6 +201,16 @@ class TestErrorSummary:
         assert top_errors[1]["type"] == "type_b"
         assert top_errors[1]["count"] == 3
 
+    def test_get_top_errors_many_types(self):
+        """Test top errors match a full sort over many error types."""
+        errors = ErrorSummary()
+        errors.error_types = {f"type_{i}": (i * 7919) % 97 for i in range(10_000)}
+
+        expected = sorted(errors.error_types.items(), key=lambda x: x[1], reverse=True)
+        top_errors = errors.get_top_errors(5)
+
+        assert [(e["type"], e["count"]) for e in top_errors] == expected[:5]
+
 
 class TestProgressReporter:
     """Test ProgressReporter class."""
@@ -138,17 +232,22 @@ class TestProgressReporter:
 
     def test_update_processed(self):
         """Test updating processed records."""
-        reporter = ProgressReporter(report_interval_seconds=1)
+        now = [0.0]
+        reporter = ProgressReporter(report_interval_seconds=1, clock=lambda: now[0])
+        reports = []
+        reporter.register_callback(reports.append)
         reporter.start(100)
 
         # Update processed records
         reporter.update_processed(10)
         assert reporter.metrics.processed_records == 10
+        assert reports == []
 
-        # Wait and update again
-        time.sleep(1.1)  # Wait longer than report interval
+        # Advance past the report interval and update again
+        now[0] += 2
         reporter.update_processed(5)
         assert reporter.metrics.processed_records == 15
+        assert len(reports) == 1
 
     def test_update_failed(self):
         """Test updating failed records."""
@@ -244,6 +343,7 @@ class TestReportGenerator:
         assert summary["total_records"] == 1000
         assert summary["processed"] == 750
         assert summary["failed"] == 25
+        assert summary["recent_performance"].endswith("records/sec")
 
     def test_generate_detailed_report(self):
         """Test detailed report generation."""
@@ -302,6 +402,14 @@ class TestReportGenerator:
         assert "SUMMARY" in text_report
         assert "ERRORS" in text_report
         assert "RECOMMENDATIONS" in text_report
+        assert "Recent Performance:" in text_report
+
+    def test_generate_export_report_unsupported_format(self):
+        """Test export report rejects unknown formats."""
+        with pytest.raises(ValueError, match="Unsupported format: xml"):
+            ReportGenerator.generate_export_report(
+                ProcessingMetrics(), ErrorSummary(), "xml"
+            )
 
 
 class TestAlertManager:
@@ -389,3 +497,45 @@ class TestAlertManager:
         assert summary["total_alerts"] > 0
         assert "alert_counts" in summary
         assert "recent_alerts" in summary
+
+    def test_alert_summary_counts_repeated_checks(self):
+        """Test alert counts accumulate across repeated checks."""
+        manager = AlertManager()
+
+        metrics = ProcessingMetrics()
+        metrics.processed_records = 100
+        metrics.memory_usage_mb = 1200
+
+        errors = ErrorSummary()
+        errors.total_errors = 15
+
+        for _ in range(3):
+            manager.check_metrics(metrics, errors)
+
+        summary = manager.get_alert_summary()
+        assert summary["total_alerts"] == 6
+        assert summary["alert_counts"] == {
+            "high_error_rate": 3,
+            "high_memory_usage": 3,
+        }
+        assert len(summary["recent_alerts"]) == 6
+
+    def test_alert_summary_follows_trimmed_alerts(self):
+        """Test alert counts stay in step when alerts_triggered is trimmed."""
+        manager = AlertManager()
+
+        metrics = ProcessingMetrics()
+        metrics.processed_records = 100
+        metrics.memory_usage_mb = 1200
+
+        errors = ErrorSummary()
+        errors.total_errors = 15
+
+        manager.check_metrics(metrics, errors)
+        del manager.alerts_triggered[0]
+
+        summary = manager.get_alert_summary()
+        assert summary["total_alerts"] == 1
+        assert summary["alert_counts"] == {
+            manager.alerts_triggered[0]["type"]: 1,
+        }
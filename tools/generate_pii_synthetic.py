@@ -3,17 +3,34 @@
 
 Usage:
   python tools/generate_pii_synthetic.py --count 1000 --out tests/fixtures/pii_synthetic_samples_large.jsonl
+  python tools/generate_pii_synthetic.py --count 1000000 --jobs 0 --out /tmp/pii.jsonl
 
 This script creates records with a variety of PII types: names, dates, phones, emails, SSNs, addresses.
 """
 
 import argparse
-import json
+import os
 import random
 from datetime import datetime
+from multiprocessing import Pool
 
+# Records are written as compact UTF-8 JSON lines
+try:
+    import orjson
 
-FIRST_NAMES = [
+    def dump_line(rec) -> bytes:
+        return orjson.dumps(rec, option=orjson.OPT_APPEND_NEWLINE)
+
+except ImportError:
+    # orjson is optional; fall back to the stdlib with matching output
+    import json
+
+    def dump_line(rec) -> bytes:
+        line = json.dumps(rec, separators=(",", ":"), ensure_ascii=False)
+        return (line + "\n").encode("utf-8")
+
+
+FIRST_NAMES = (
     "Alice",
     "Bob",
     "Carol",
@@ -34,8 +51,8 @@ FIRST_NAMES = [
     "Mikhail",
     "Fatima",
     "Aisha",
-]
-LAST_NAMES = [
+)
+LAST_NAMES = (
     "Johnson",
     "Lee",
     "Garcia",
@@ -46,52 +63,58 @@ LAST_NAMES = [
     "Patel",
     "Zhang",
     "Wang",
-]
+)
+COUNTRY_CODES = ("+1", "+44", "+34", "+86", "+61")
+EMAIL_DOMAINS = ("example.com", "example.org", "example.cn", "mail.test")
+
+# Lines joined into each write() call on the output file
+WRITE_BATCH = 8192
+# Upper bound on records rendered per worker task with --jobs
+CHUNK_RECORDS = 100_000
 
 
-def random_dob():
-    year = random.randint(1940, 2005)
-    month = random.randint(1, 12)
-    day = random.randint(1, 28)
+def random_dob(rng):
+    year = rng.randint(1940, 2005)
+    month = rng.randint(1, 12)
+    day = rng.randint(1, 28)
     return f"{year:04d}-{month:02d}-{day:02d}"
 
 
-def random_phone():
+def random_phone(rng):
     # international-ish
-    country = random.choice(["+1", "+44", "+34", "+86", "+61"])
-    return f"{country} {random.randint(100, 999)}-{random.randint(100, 999)}-{random.randint(1000, 9999)}"
+    country = rng.choice(COUNTRY_CODES)
+    return f"{country} {rng.randint(100, 999)}-{rng.randint(100, 999)}-{rng.randint(1000, 9999)}"
 
 
-def random_email(first, last):
-    domain = random.choice(["example.com", "example.org", "example.cn", "mail.test"])
+def random_email(rng, first, last):
+    domain = rng.choice(EMAIL_DOMAINS)
     local = f"{first[0].lower()}{last.lower()}"
     return f"{local}@{domain}"
 
 
-def random_ssn():
-    return f"{random.randint(100, 999)}-{random.randint(10, 99)}-{random.randint(1000, 9999)}"
+def random_ssn(rng):
+    return f"{rng.randint(100, 999)}-{rng.randint(10, 99)}-{rng.randint(1000, 9999)}"
 
 
-def maybe(val, p=0.8):
-    return val if random.random() < p else None
+def maybe(rng, make, *args, p=0.8):
+    # only build the value when it is kept
+    return make(rng, *args) if rng.random() < p else None
 
 
-def make_record(i):
+def make_record(rng, i, first, last):
     # sometimes no PII
-    if random.random() < 0.12:
+    if rng.random() < 0.12:
         return {
             "id": f"gen-{i:06d}",
             "text": "Routine equipment check. No patient data.",
             "pii": [],
         }
 
-    first = random.choice(FIRST_NAMES)
-    last = random.choice(LAST_NAMES)
-    name = f"{first} {last}" if random.random() < 0.9 else f"{first}"
-    dob = maybe(random_dob(), 0.9)
-    phone = maybe(random_phone(), 0.9)
-    email = maybe(random_email(first, last), 0.85)
-    ssn = maybe(random_ssn(), 0.25)
+    name = f"{first} {last}" if rng.random() < 0.9 else f"{first}"
+    dob = maybe(rng, random_dob, p=0.9)
+    phone = maybe(rng, random_phone, p=0.9)
+    email = maybe(rng, random_email, first, last, p=0.85)
+    ssn = maybe(rng, random_ssn, p=0.25)
     lines = [f"Patient: {name}"]
     if dob:
         lines.append(f"DOB: {dob}")
@@ -102,24 +125,68 @@ def make_record(i):
     if ssn:
         lines.append(f"SSN: {ssn}")
     text = ", ".join(lines)
-    pii = [v for v in [maybe(name, 0.99), dob, phone, email, ssn] if v]
+    pii = [
+        v for v in [name if rng.random() < 0.99 else None, dob, phone, email, ssn] if v
+    ]
     return {"id": f"gen-{i:06d}", "text": text, "pii": pii}
 
 
+def iter_jsonl_batches(rng, start, stop):
+    """Yield JSONL bytes for records start..stop-1, WRITE_BATCH lines at a time."""
+    # draw all names up front instead of two choice() calls per record
+    count = stop - start
+    firsts = rng.choices(FIRST_NAMES, k=count)
+    lasts = rng.choices(LAST_NAMES, k=count)
+    buf = []
+    for i, first, last in zip(range(start, stop), firsts, lasts):
+        buf.append(dump_line(make_record(rng, i, first, last)))
+        if len(buf) >= WRITE_BATCH:
+            yield b"".join(buf)
+            buf.clear()
+    if buf:
+        yield b"".join(buf)
+
+
+def generate_range(task):
+    """Pool worker: render one contiguous record range with its own RNG."""
+    start, stop, seed = task
+    rng = random.Random(seed + start)
+    return b"".join(iter_jsonl_batches(rng, start, stop))
+
+
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--count", type=int, default=1000)
     parser.add_argument(
         "--out", type=str, default="tests/fixtures/pii_synthetic_samples_large.jsonl"
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="worker processes (0 = all CPUs); output differs from --jobs 1",
+    )
     args = parser.parse_args()
+    if args.jobs < 0:
+        parser.error("--jobs must be 0 (all CPUs) or a positive number")
 
-    random.seed(42)
+    seed = 42
     out_path = args.out
-    with open(out_path, "w", encoding="utf-8") as f:
-        for i in range(1, args.count + 1):
-            rec = make_record(i)
-            f.write(json.dumps(rec, ensure_ascii=False) + "\n")
+    jobs = args.jobs or os.cpu_count() or 1
+    with open(out_path, "wb") as f:
+        if jobs == 1:
+            for chunk in iter_jsonl_batches(random.Random(seed), 1, args.count + 1):
+                f.write(chunk)
+        else:
+            # contiguous ranges, bounded so only a few chunks are held at once
+            step = max(1, min(CHUNK_RECORDS, -(-args.count // jobs)))
+            tasks = [
+                (lo, min(lo + step, args.count + 1), seed)
+                for lo in range(1, args.count + 1, step)
+            ]
+            with Pool(jobs) as pool:
+                for chunk in pool.imap(generate_range, tasks):
+                    f.write(chunk)
 
     print(f"Wrote {args.count} synthetic records to {out_path}")
 